@@ -1,15 +1,50 @@
 import pyvisa
 import re
 import math
+import numbers
 import logging
+import threading
+from contextlib import contextmanager
 
 
 logger = logging.getLogger(__name__)
 
+_FLOAT_RE = re.compile(r"[+-]?\d+(?:\.\d+)?(?:[Ee][+-]?\d+)?")
+_GPIB_RE = re.compile(r"^GPIB(\d+)::(\d+)::INSTR$", re.IGNORECASE)
+_TSP_2600_MODEL_RE = re.compile(r"\b26\d{2}[A-Z]?\b")
+
+# Opening a VISA ResourceManager loads the driver and can take seconds on NI-VISA,
+# so connections share one per process and the last user closes it.
+_SHARED_RM = None
+_SHARED_RM_USERS = 0
+_SHARED_RM_LOCK = threading.Lock()
+
+
+def _acquire_resource_manager():
+    global _SHARED_RM, _SHARED_RM_USERS
+    with _SHARED_RM_LOCK:
+        if _SHARED_RM is None:
+            _SHARED_RM = pyvisa.ResourceManager()
+            logger.info("VISA ResourceManager initialized")
+        _SHARED_RM_USERS += 1
+        return _SHARED_RM
+
+
+def _release_resource_manager():
+    global _SHARED_RM, _SHARED_RM_USERS
+    with _SHARED_RM_LOCK:
+        _SHARED_RM_USERS = max(0, _SHARED_RM_USERS - 1)
+        if _SHARED_RM_USERS or _SHARED_RM is None:
+            return
+        rm = _SHARED_RM
+        _SHARED_RM = None
+    rm.close()
+
 
 class KeithleyConnection:
     MAX_ABS_VOLTAGE = 210.0
     MAX_COMPLIANCE_UA = 1_000_000.0
+    _TSP_SWEEP_FN = "iv_fast_sweep"
 
     def __init__(self):
         self.rm = None
@@ -19,12 +54,18 @@ class KeithleyConnection:
         self.channel = "smua"
         self.last_resource = ""
         self.output_enabled = False
+        self._tsp_sweep_loaded = False
+        self._tsp_buffer_capacity = 0
+        self._tpl = {}
+        self._errcheck_depth = 0
+        # Fast sweeps run on a worker thread; serialize VISA traffic so calls never interleave.
+        self._io_lock = threading.RLock()
+        self._build_command_templates()
 
     def initialize(self):
         if self.rm is None:
             try:
-                self.rm = pyvisa.ResourceManager()
-                logger.info("VISA ResourceManager initialized")
+                self.rm = _acquire_resource_manager()
             except Exception:
                 logger.exception("Failed to initialize VISA ResourceManager")
                 raise
@@ -32,7 +73,7 @@ class KeithleyConnection:
     def list_devices(self):
         self.initialize()
         try:
-            resources = list(self.rm.list_resources())
+            resources = self.rm.list_resources()
             logger.info("Detected %d VISA resources", len(resources))
             return resources
         except Exception:
@@ -97,16 +138,20 @@ class KeithleyConnection:
             except Exception:
                 logger.exception("Failed to close previous instrument session")
                 pass
+        self._tsp_sweep_loaded = False
         self.inst = self._open_resource_with_gpib_fallback(resource_name)
         self.last_resource = getattr(self.inst, "resource_name", resource_name)
         self.inst.timeout = 5000
         self.inst.write_termination = "\n"
         self.inst.read_termination = "\n"
+        # Large sweep dumps arrive in one viRead instead of many 20 KB chunks.
+        self.inst.chunk_size = 1 << 20
 
         try:
             self.idn = self._query_id()
             self._validate_instrument_identity()
             self.mode = "tsp2600" if self._looks_like_2600_tsp_model(self.idn) else "scpi"
+            self._build_command_templates()
             if self.mode == "tsp2600":
                 self._setup_2600_defaults()
             else:
@@ -124,11 +169,8 @@ class KeithleyConnection:
         self._validate_voltage(voltage)
         try:
             self.enable_output()
-            if self.mode == "tsp2600":
-                self._write(f"{self.channel}.source.levelv = {voltage}")
-            else:
-                self._write(f"SOUR:VOLT {voltage}")
-            self._check_instrument_errors()
+            self._write(self._tpl["levelv"] + format(voltage, ".12g"))
+            self._maybe_check_errors()
             logger.debug("Voltage set to %s V", voltage)
         except Exception:
             logger.exception("Failed setting voltage to %s V", voltage)
@@ -139,10 +181,7 @@ class KeithleyConnection:
         self._validate_compliance(compliance_ua)
         compliance_a = compliance_ua * 1e-6
         try:
-            if self.mode == "tsp2600":
-                self._write(f"{self.channel}.source.limiti = {compliance_a}")
-            else:
-                self._write(f"SENS:CURR:PROT {compliance_a}")
+            self._write(self._tpl["limiti"] + format(compliance_a, ".12g"))
             self._check_instrument_errors()
             logger.debug("Compliance set to %s uA", compliance_ua)
         except Exception:
@@ -152,13 +191,13 @@ class KeithleyConnection:
     def measure_current(self) -> float:
         self._require_connection()
         try:
-            if self.mode == "tsp2600":
-                raw = self._query(f"print({self.channel}.measure.i())")
-            else:
-                raw = self._query("MEAS:CURR?")
-            value = self._extract_first_float(raw)
-            # Keithley overflow convention for invalid/overrange values.
-            if abs(value) >= 9.9e37:
+            raw = self._query(self._tpl["measure_i"])
+            try:
+                value = float(raw.split(",", 1)[0])
+            except ValueError:
+                value = self._extract_first_float(raw)
+            # Keithley overflow convention for invalid/overrange values (9.91e37 is NaN).
+            if not math.isfinite(value) or math.fabs(value) >= 9.9e37:
                 raise RuntimeError(
                     "Current reading is overrange/compliance (instrument returned overflow). "
                     "Reduce voltage or increase current compliance/range."
@@ -177,55 +216,42 @@ class KeithleyConnection:
         if not isinstance(delay_s, (int, float)) or not math.isfinite(delay_s) or delay_s < 0:
             raise RuntimeError("Delay must be a non-negative finite number")
 
-        for v in voltages:
-            self._validate_voltage(v)
+        values = self._validate_voltages(voltages)
 
         original_timeout = getattr(self.inst, "timeout", 5000)
-        # Estimate sweep time and add a large safety margin for instrument processing.
-        # The total time is more than just sum of delays.
-        # We use a safety factor and enforce a 20s minimum, but do not cap long runs.
-        estimated_sweep_s = len(voltages) * max(delay_s, 1e-6)
-        safety_factor = 8
-        estimated_ms = int(estimated_sweep_s * 1000 * safety_factor)
+        # Estimate sweep time from the programmed delay plus a fixed per-point cost for
+        # source settling, measurement and buffering, then add a safety margin.
+        # We enforce a 20s minimum, but do not cap long runs.
+        per_point_overhead_ms = 5.0
+        safety_factor = 3
+        estimated_ms = int(len(values) * (delay_s * 1000 + per_point_overhead_ms) * safety_factor)
         timeout_ms = max(20_000, estimated_ms)
         self.inst.timeout = max(original_timeout, timeout_ms)
         logger.info(
             "Fast TSP sweep timeout set to %d ms (original %d ms, points=%d, delay=%s s)",
             self.inst.timeout,
             original_timeout,
-            len(voltages),
+            len(values),
             delay_s,
         )
         try:
-            self.enable_output()
-            points = ",".join(f"{float(v):.12g}" for v in voltages)
-            # Execute full loop on instrument to avoid host-side timing jitter.
-            script = [
-                "loadandrunscript",
-                f"local pts={{ {points} }}",
-                "local out=''",
-                "for idx,v in ipairs(pts) do",
-                f"{self.channel}.source.levelv=v",
-                f"delay({delay_s:.9g})",
-                f"local i={self.channel}.measure.i()",
-                "out=out..string.format('%.12g,%.12e;', v, i)",
-                "end",
-                "print(out)",
-                "endscript",
-            ]
-            cmd = "\n".join(script)
-            raw = self._query(cmd).strip()
-            pairs = [p for p in raw.split(";") if p]
-            result = []
-            for pair in pairs:
-                try:
-                    sv, si = pair.split(",", 1)
-                    result.append((float(sv), float(si)))
-                except Exception:
-                    continue
+            with self.batched_error_checks():
+                self.enable_output()
+                if not self._tsp_sweep_loaded:
+                    self._install_tsp_sweep_function()
+                # Execute the loop on the instrument to avoid host-side timing jitter. The reading buffer
+                # is finite, so longer sweeps run as consecutive buffer-sized calls; a short read would
+                # otherwise leave the host waiting out the whole timeout.
+                chunk = self._tsp_buffer_capacity or len(values)
+                currents = []
+                for start in range(0, len(values), chunk):
+                    part = values[start:start + chunk]
+                    points = ",".join([format(v, ".12g") for v in part])
+                    cmd = f"{self._TSP_SWEEP_FN}({{ {points} }}, {delay_s:.9g})"
+                    currents.extend(self._query_binary(cmd, len(part)))
+            result = list(zip(values, currents))
             if not result:
                 raise RuntimeError("Instrument fast sweep returned no parseable data")
-            self._check_instrument_errors()
             return result
         except Exception:
             logger.exception("Fast TSP sweep failed")
@@ -392,12 +418,9 @@ class KeithleyConnection:
     def enable_output(self):
         self._require_connection()
         try:
-            if self.mode == "tsp2600":
-                self._write(f"{self.channel}.source.output = {self.channel}.OUTPUT_ON")
-            else:
-                self._write("OUTP ON")
+            self._write(self._tpl["output_on"])
             self.output_enabled = True
-            self._check_instrument_errors()
+            self._maybe_check_errors()
         except Exception:
             logger.exception("Failed to enable output")
             raise
@@ -405,10 +428,7 @@ class KeithleyConnection:
     def disable_output(self):
         self._require_connection()
         try:
-            if self.mode == "tsp2600":
-                self._write(f"{self.channel}.source.output = {self.channel}.OUTPUT_OFF")
-            else:
-                self._write("OUTP OFF")
+            self._write(self._tpl["output_off"])
             self.output_enabled = False
             self._check_instrument_errors()
         except Exception:
@@ -418,15 +438,9 @@ class KeithleyConnection:
     def zero_output(self):
         if self.inst:
             try:
-                if self.mode == "tsp2600":
-                    self._write(f"{self.channel}.source.levelv = 0")
-                else:
-                    self._write("SOUR:VOLT 0")
+                self._write(self._shutdown_sequence_cmd())
             finally:
-                try:
-                    self.disable_output()
-                except Exception:
-                    self.output_enabled = False
+                self.output_enabled = False
 
     def close(self):
         logger.info("Closing connection for resource: %s", self.last_resource or "unknown")
@@ -444,12 +458,37 @@ class KeithleyConnection:
             self.inst = None
         if self.rm:
             try:
-                self.rm.close()
+                _release_resource_manager()
             except Exception:
                 logger.exception("Failed to close VISA ResourceManager")
                 pass
             self.rm = None
 
+    def _build_command_templates(self):
+        ch = self.channel
+        if self.mode == "tsp2600":
+            self._tpl = {
+                "levelv": f"{ch}.source.levelv = ",
+                "limiti": f"{ch}.source.limiti = ",
+                "measure_i": f"print({ch}.measure.i())",
+                "output_on": f"{ch}.source.output = {ch}.OUTPUT_ON",
+                "output_off": f"{ch}.source.output = {ch}.OUTPUT_OFF",
+            }
+        else:
+            self._tpl = {
+                "levelv": "SOUR:VOLT ",
+                "limiti": "SENS:CURR:PROT ",
+                "measure_i": "MEAS:CURR?",
+                "output_on": "OUTP ON",
+                "output_off": "OUTP OFF",
+            }
+
+    def _shutdown_sequence_cmd(self) -> str:
+        # Zero the source and switch the output off in one write.
+        if self.mode == "tsp2600":
+            return f"{self._tpl['levelv']}0 {self._tpl['output_off']}"
+        return f"{self._tpl['levelv']}0;:{self._tpl['output_off']}"
+
     def _require_connection(self):
         if not self.inst:
             raise RuntimeError("Not connected")
@@ -472,30 +511,84 @@ class KeithleyConnection:
             )
 
     def _setup_scpi_defaults(self):
-        self._write("*CLS")
-        self._write("OUTP OFF")
-        self._write("SOUR:VOLT 0")
-        self._write("SENS:CURR:RANG:AUTO ON")
-        self._write("SENS:CURR:PROT 1E-6")
+        # One compound IEEE-488.2 command instead of a round-trip per setting.
+        self._write("*CLS;:OUTP OFF;:SOUR:VOLT 0;:SENS:CURR:RANG:AUTO ON;:SENS:CURR:PROT 1E-6")
         self._check_instrument_errors()
 
     def _setup_2600_defaults(self):
-        self._write(f"{self.channel}.reset()")
-        self._write(f"{self.channel}.source.func = {self.channel}.OUTPUT_DCVOLTS")
-        self._write(f"{self.channel}.source.levelv = 0")
-        self._write(f"{self.channel}.source.limiti = 1e-6")
-        self._write(f"{self.channel}.measure.autorangei = {self.channel}.AUTORANGE_ON")
-        self._write(f"{self.channel}.source.output = {self.channel}.OUTPUT_OFF")
+        ch = self.channel
+        self._write(
+            " ".join(
+                [
+                    f"{ch}.reset()",
+                    f"{ch}.source.func = {ch}.OUTPUT_DCVOLTS",
+                    f"{ch}.source.levelv = 0",
+                    f"{ch}.source.limiti = 1e-6",
+                    f"{ch}.measure.autorangei = {ch}.AUTORANGE_ON",
+                    f"{ch}.source.output = {ch}.OUTPUT_OFF",
+                ]
+            )
+        )
+        self._install_tsp_sweep_function()
         self._check_instrument_errors()
 
+    def _install_tsp_sweep_function(self):
+        # Compile the sweep loop once per connection; each sweep then only sends the point list.
+        # Readings go into the instrument buffer and are dumped once with printbuffer as a
+        # REAL64 block: 8 bytes per reading instead of ~20 ASCII characters.
+        ch = self.channel
+        buf = f"{ch}.nvbuffer1"
+        script = [
+            "loadandrunscript",
+            f"function {self._TSP_SWEEP_FN}(pts, d)",
+            f"{buf}.clear()",
+            f"{buf}.appendmode=1",
+            f"{buf}.collectsourcevalues=0",
+            "for idx,v in ipairs(pts) do",
+            f"{ch}.source.levelv=v",
+            "delay(d)",
+            f"{ch}.measure.i({buf})",
+            "end",
+            "format.data=format.REAL64",
+            "format.byteorder=format.LITTLEENDIAN",
+            f"printbuffer(1, {buf}.n, {buf}.readings)",
+            "format.data=format.ASCII",
+            "end",
+            "endscript",
+        ]
+        self._write("\n".join(script))
+        self._tsp_buffer_capacity = max(1, int(self._extract_first_float(self._query(f"print({buf}.capacity)"))))
+        self._tsp_sweep_loaded = True
+
     @staticmethod
     def _extract_first_float(raw: str) -> float:
-        first = raw.strip().split(",")[0]
-        match = re.search(r"[+-]?\d+(?:\.\d+)?(?:[Ee][+-]?\d+)?", first)
+        first = raw.strip().split(",", 1)[0]
+        try:
+            value = float(first)
+            if math.isfinite(value):
+                return value
+        except ValueError:
+            pass
+        match = _FLOAT_RE.search(first)
         if not match:
             raise RuntimeError(f"Unexpected current response: {raw.strip()}")
         return float(match.group(0))
 
+    @contextmanager
+    def batched_error_checks(self):
+        # Defer per-command error queue polling and drain the queue once on exit.
+        self._errcheck_depth += 1
+        try:
+            yield
+        finally:
+            self._errcheck_depth -= 1
+        if self._errcheck_depth == 0:
+            self._check_instrument_errors()
+
+    def _maybe_check_errors(self):
+        if self._errcheck_depth == 0:
+            self._check_instrument_errors()
+
     def _check_instrument_errors(self):
         if not self.inst:
             return
@@ -533,7 +626,7 @@ class KeithleyConnection:
 
     def _open_resource_with_gpib_fallback(self, resource_name: str):
         candidates = [resource_name]
-        gpib_match = re.match(r"^GPIB(\d+)::(\d+)::INSTR$", resource_name, re.IGNORECASE)
+        gpib_match = _GPIB_RE.match(resource_name)
         if gpib_match:
             bus = int(gpib_match.group(1))
             addr = gpib_match.group(2)
@@ -567,11 +660,12 @@ class KeithleyConnection:
 
     @staticmethod
     def _looks_like_2600_tsp_model(identity: str) -> bool:
-        return re.search(r"\b26\d{2}[A-Z]?\b", identity.upper()) is not None
+        return _TSP_2600_MODEL_RE.search(identity.upper()) is not None
 
     def _write(self, cmd: str):
         try:
-            self.inst.write(cmd)
+            with self._io_lock:
+                self.inst.write(cmd)
         except Exception:
             logger.exception(
                 "VISA write failed [resource=%s mode=%s cmd=%s]",
@@ -583,7 +677,8 @@ class KeithleyConnection:
 
     def _query(self, cmd: str):
         try:
-            return self.inst.query(cmd)
+            with self._io_lock:
+                return self.inst.query(cmd)
         except Exception:
             logger.exception(
                 "VISA query failed [resource=%s mode=%s cmd=%s]",
@@ -593,6 +688,26 @@ class KeithleyConnection:
             )
             raise
 
+    def _query_binary(self, cmd: str, points: int):
+        try:
+            # The 2600 emits an indefinite-length "#0" block, so the point count sizes the read.
+            with self._io_lock:
+                return self.inst.query_binary_values(
+                    cmd,
+                    datatype="d",
+                    is_big_endian=False,
+                    container=list,
+                    data_points=points,
+                )
+        except Exception:
+            logger.exception(
+                "VISA binary query failed [resource=%s mode=%s points=%d]",
+                self.last_resource or "unknown",
+                self.mode,
+                points,
+            )
+            raise
+
     @classmethod
     def _validate_voltage(cls, voltage: float):
         if not isinstance(voltage, (int, float)) or not math.isfinite(voltage):
@@ -600,6 +715,20 @@ class KeithleyConnection:
         if abs(voltage) > cls.MAX_ABS_VOLTAGE:
             raise RuntimeError(f"Voltage exceeds allowed range (+/-{cls.MAX_ABS_VOLTAGE:g} V)")
 
+    @classmethod
+    def _validate_voltages(cls, voltages):
+        # Whole-list check for sweeps: one type pass, one conversion pass, then C-level all()/max().
+        # float() alone would also accept numeric strings, so check for real numbers (not bools) first.
+        real = numbers.Real
+        if not all(isinstance(v, real) and not isinstance(v, bool) for v in voltages):
+            raise RuntimeError("Voltage must be a finite number")
+        values = [float(v) for v in voltages]
+        if not all(map(math.isfinite, values)):
+            raise RuntimeError("Voltage must be a finite number")
+        if max(map(abs, values)) > cls.MAX_ABS_VOLTAGE:
+            raise RuntimeError(f"Voltage exceeds allowed range (+/-{cls.MAX_ABS_VOLTAGE:g} V)")
+        return values
+
     @classmethod
     def _validate_compliance(cls, compliance_ua: float):
         if not isinstance(compliance_ua, (int, float)) or not math.isfinite(compliance_ua):
@@ -1,14 +1,43 @@
+from array import array
 from dataclasses import dataclass
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 import csv
 import logging
 import math
+import queue
+import threading
+import time
 
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+CSV_HEADER = [
+    "timestamp",
+    "voltage",
+    "current",
+    "sample_name",
+    "operator",
+    "notes",
+    "elapsed_s",
+    "cycle_id",
+    "plot_mode",
+    "run_description",
+]
+
+_CSV_WRITE_CHUNK = 4096
+_CSV_SPECIAL_CHARS = (",", '"', "\r", "\n")
+
+
+def _csv_escape(value: str) -> str:
+    # Same result as csv.QUOTE_MINIMAL, without the per-field writer overhead.
+    if any(ch in value for ch in _CSV_SPECIAL_CHARS):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+@dataclass(slots=True)
 class Measurement:
     timestamp: str
     voltage: float
@@ -24,17 +53,50 @@ class Measurement:
 
 class DataLogger:
     def __init__(self):
-        self.rows = []
+        self._rows = []
+        self._voltages = array("d")
+        self._currents = array("d")
         self.output_file = None
+        self._header_written = False
         self.sample_name = ""
         self.operator = ""
         self.notes = ""
         self.run_description = ""
         self._pd_text_existing_count = 0
+        self._append_buffer = []
+        self._append_threshold = 256
+        self._append_flush_s = 0.5
+        self._last_flush_t = time.monotonic()
+        self._ts_cache = (0, "")
+        self._write_q = queue.Queue()
+        self._writer_thread = None
+        self._write_error = None
+        # Bumped on every change to the row set so readers can cache derived data.
+        self.revision = 0
+
+    @property
+    def rows(self):
+        return self._rows
+
+    @rows.setter
+    def rows(self, value):
+        self._rows = value if isinstance(value, list) else list(value)
+        self.revision += 1
+        self._voltages = array("d", (row.voltage for row in self._rows))
+        self._currents = array("d", (row.current for row in self._rows))
+
+    @property
+    def voltages(self):
+        # Column view kept in step with rows; use for bulk numeric work instead of walking Measurement objects.
+        return self._voltages
+
+    @property
+    def currents(self):
+        return self._currents
 
     def add(self, voltage: float, current: float, auto_save: bool = False):
         measurement = Measurement(
-            timestamp=datetime.now().isoformat(timespec="seconds"),
+            timestamp=self._timestamp(),
             voltage=voltage,
             current=current,
             sample_name=self.sample_name,
@@ -42,11 +104,74 @@ class DataLogger:
             notes=self.notes,
             run_description=self.run_description,
         )
-        self.rows.append(measurement)
+        if self._append_buffer and (
+            not auto_save
+            or len(self._append_buffer) >= self._append_threshold
+            or time.monotonic() - self._last_flush_t >= self._append_flush_s
+        ):
+            # Flush before appending: buffered rows have been annotated by now, the new one has not.
+            # Threshold flushes during auto-save are written by the background writer.
+            self.flush(background=auto_save)
+        self._rows.append(measurement)
+        self.revision += 1
+        self._voltages.append(measurement.voltage)
+        self._currents.append(measurement.current)
         if auto_save:
             if not self.output_file:
                 raise RuntimeError("Output file is not set for auto-save")
-            self._append_row(measurement)
+            self._append_buffer.append(measurement)
+
+    def add_many(self, voltages, currents, cycle_ids, elapsed, plot_mode: str = "iv", auto_save: bool = False):
+        # Bulk form of add() + annotation for results that arrive all at once (fast instrument runs).
+        timestamp = self._timestamp()
+        batch = [
+            Measurement(
+                timestamp=timestamp,
+                voltage=voltage,
+                current=current,
+                sample_name=self.sample_name,
+                operator=self.operator,
+                notes=self.notes,
+                elapsed_s=None if point_t is None else float(point_t),
+                cycle_id=int(cycle_id),
+                plot_mode=plot_mode,
+                run_description=self.run_description,
+            )
+            for voltage, current, cycle_id, point_t in zip(voltages, currents, cycle_ids, elapsed)
+        ]
+        self.flush()
+        self._rows.extend(batch)
+        # Same count as the equivalent add() calls, so revision-keyed caches behave identically.
+        self.revision += len(batch)
+        self._voltages.extend(row.voltage for row in batch)
+        self._currents.extend(row.current for row in batch)
+        if auto_save and batch:
+            if not self.output_file:
+                raise RuntimeError("Output file is not set for auto-save")
+            self._append_buffer = batch
+            self.flush()
+        return batch
+
+    def _timestamp(self):
+        # Timestamps have one-second resolution, so format once per wall-clock second.
+        sec = int(time.time())
+        if sec != self._ts_cache[0]:
+            self._ts_cache = (sec, time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec)))
+        return self._ts_cache[1]
+
+    def flush(self, background: bool = False):
+        # A foreground flush also waits for queued background writes, so the file is complete afterwards.
+        if not background:
+            self._wait_for_writes()
+        if not self._append_buffer:
+            return
+        pending = self._append_buffer
+        self._append_buffer = []
+        self._last_flush_t = time.monotonic()
+        self._append_rows(pending, background=background)
+
+    def close(self):
+        self.flush()
 
     def set_metadata(self, sample_name: str, operator: str, notes: str):
         self.sample_name = sample_name.strip()
@@ -57,63 +182,60 @@ class DataLogger:
         self.run_description = description.strip()
 
     def set_output_file(self, file_path: str, reset_file: bool = False):
+        self.flush()
         self.output_file = Path(file_path)
         self.output_file.parent.mkdir(parents=True, exist_ok=True)
         self._pd_text_existing_count = 0
-        if self.output_file.suffix.lower() == ".txt" and not reset_file and self.output_file.exists():
+        # Checked once here so per-row appends never need to stat the file.
+        self._header_written = (
+            not reset_file and self.output_file.exists() and self.output_file.stat().st_size > 0
+        )
+        if self.output_file.suffix.lower() == ".txt" and self._header_written:
             self._pd_text_existing_count = self._count_existing_pd_text_rows(self.output_file)
         if reset_file:
             self._write_file_header()
 
     def clear(self):
-        self.rows.clear()
+        self.flush()
+        self._rows.clear()
+        self.revision += 1
+        del self._voltages[:]
+        del self._currents[:]
+
+    def trim_to(self, max_rows: int):
+        # Drop the oldest rows in place so the column arrays are not rebuilt.
+        if len(self._rows) > max_rows:
+            del self._rows[:-max_rows or None]
+            self.revision += 1
+            del self._voltages[:-max_rows or None]
+            del self._currents[:-max_rows or None]
 
     def save_csv(self, file_path: str = ""):
+        self.flush()
         path = Path(file_path) if file_path else self.output_file
         if not path:
             raise RuntimeError("No output file selected")
         path.parent.mkdir(parents=True, exist_ok=True)
         if path.suffix.lower() == ".txt":
             original_output_file = self.output_file
+            original_header_written = self._header_written
             self.output_file = path
             try:
                 self._write_pd_text_file()
             finally:
-                self.output_file = path if not file_path else original_output_file
+                if file_path:
+                    self.output_file = original_output_file
+                    self._header_written = original_header_written
             return
+        csv_line = self._csv_line
+        rows = self.rows
         with path.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(
-                [
-                    "timestamp",
-                    "voltage",
-                    "current",
-                    "sample_name",
-                    "operator",
-                    "notes",
-                    "elapsed_s",
-                    "cycle_id",
-                    "plot_mode",
-                    "run_description",
-                ]
-            )
-            for row in self.rows:
-                writer.writerow(
-                    [
-                        row.timestamp,
-                        row.voltage,
-                        row.current,
-                        row.sample_name,
-                        row.operator,
-                        row.notes,
-                        "" if row.elapsed_s is None else row.elapsed_s,
-                        row.cycle_id,
-                        row.plot_mode,
-                        row.run_description,
-                    ]
-                )
+            f.write(",".join(CSV_HEADER) + "\r\n")
+            for start in range(0, len(rows), _CSV_WRITE_CHUNK):
+                f.write("".join([csv_line(row) for row in rows[start:start + _CSV_WRITE_CHUNK]]))
 
     def load_csv(self, file_path: str):
+        self.flush()
         path = Path(file_path)
         if not path.exists():
             raise RuntimeError(f"File not found: {file_path}")
@@ -122,35 +244,61 @@ class DataLogger:
             return
 
         with path.open("r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            if not reader.fieldnames:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if not header:
                 raise RuntimeError("CSV file has no header")
 
             required = {"timestamp", "voltage", "current"}
-            if not required.issubset(set(reader.fieldnames)):
+            if not required.issubset(set(header)):
                 raise RuntimeError(
                     "CSV must contain at least: timestamp, voltage, current"
                 )
 
+            # Resolve column positions once; absent optional columns point at a trailing blank pad.
+            width = len(header)
+            index = {name: pos for pos, name in enumerate(header)}
+            pick = itemgetter(*(index.get(name, width) for name in CSV_HEADER))
+            pad = [""] * (width + 1)
+            strip = str.strip
+
             loaded = []
-            for i, row in enumerate(reader, start=2):
+            append = loaded.append
+            i = 1
+            for fields in reader:
+                if not fields:
+                    continue
+                i += 1
+                # Normalize to the header width: short rows are padded, extra trailing fields are ignored.
+                if len(fields) != width:
+                    fields = fields[:width] + pad[min(len(fields), width):]
+                else:
+                    fields.append("")
                 try:
-                    loaded.append(
+                    (
+                        timestamp,
+                        voltage,
+                        current,
+                        sample_name,
+                        operator,
+                        notes,
+                        elapsed_s,
+                        cycle_id,
+                        plot_mode,
+                        run_description,
+                    ) = map(strip, pick(fields))
+                    append(
                         Measurement(
-                            timestamp=(row.get("timestamp") or "").strip(),
-                            voltage=float((row.get("voltage") or "").strip()),
-                            current=float((row.get("current") or "").strip()),
-                            sample_name=(row.get("sample_name") or "").strip(),
-                            operator=(row.get("operator") or "").strip(),
-                            notes=(row.get("notes") or "").strip(),
-                            elapsed_s=(
-                                float((row.get("elapsed_s") or "").strip())
-                                if (row.get("elapsed_s") or "").strip()
-                                else None
-                            ),
-                            cycle_id=int((row.get("cycle_id") or "0").strip() or "0"),
-                            plot_mode=(row.get("plot_mode") or "iv").strip() or "iv",
-                            run_description=(row.get("run_description") or "").strip(),
+                            timestamp,
+                            float(voltage),
+                            float(current),
+                            sample_name,
+                            operator,
+                            notes,
+                            float(elapsed_s) if elapsed_s else None,
+                            int(cycle_id or "0"),
+                            plot_mode or "iv",
+                            run_description,
                         )
                     )
                 except (ValueError, TypeError) as e:
@@ -162,38 +310,80 @@ class DataLogger:
 
         self.rows = loaded
         self.output_file = path
+        self._header_written = True
+
+    @staticmethod
+    def _csv_line(row: Measurement):
+        # Matches csv.writer output (repr floats, minimal quoting, CRLF) so files stay interchangeable.
+        elapsed = "" if row.elapsed_s is None else row.elapsed_s
+        return (
+            f"{_csv_escape(row.timestamp)},{row.voltage},{row.current},"
+            f"{_csv_escape(row.sample_name)},{_csv_escape(row.operator)},{_csv_escape(row.notes)},"
+            f"{elapsed},{row.cycle_id},{_csv_escape(row.plot_mode)},{_csv_escape(row.run_description)}\r\n"
+        )
+
+    @staticmethod
+    def _is_finite_current(row: Measurement):
+        return isinstance(row.current, (int, float)) and math.isfinite(row.current)
 
     def _append_row(self, row: Measurement):
-        file_missing_or_empty = (not self.output_file.exists()) or self.output_file.stat().st_size == 0
-        if file_missing_or_empty:
+        self._append_rows([row])
+
+    def _append_rows(self, rows, background: bool = False):
+        if not self._header_written:
             self._write_file_header()
         if self.output_file.suffix.lower() == ".txt":
-            if not (isinstance(row.current, (int, float)) and math.isfinite(row.current)):
+            finite_rows = [row for row in rows if self._is_finite_current(row)]
+            if not finite_rows:
                 return
-            pulse_no = self._pd_text_existing_count + sum(
-                1 for item in self.rows
-                if isinstance(item.current, (int, float))
-                and math.isfinite(item.current)
+            # Appended rows are the tail of self.rows, so number them after everything before them.
+            pulse_no = (
+                self._pd_text_existing_count
+                + sum(1 for item in self.rows if self._is_finite_current(item))
+                - len(finite_rows)
             )
-            with self.output_file.open("a", encoding="utf-8") as f:
-                f.write(f"{pulse_no}\t{abs(row.current):.12e}\t{row.voltage:.12g}\n")
+            lines = [
+                f"{no}\t{abs(row.current):.12e}\t{row.voltage:.12g}\n"
+                for no, row in enumerate(finite_rows, start=pulse_no + 1)
+            ]
+            self._append_text(self.output_file, "".join(lines), None, background)
             return
-        with self.output_file.open("a", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(
-                [
-                    row.timestamp,
-                    row.voltage,
-                    row.current,
-                    row.sample_name,
-                    row.operator,
-                    row.notes,
-                    "" if row.elapsed_s is None else row.elapsed_s,
-                    row.cycle_id,
-                    row.plot_mode,
-                    row.run_description,
-                ]
-            )
+        self._append_text(self.output_file, "".join([self._csv_line(row) for row in rows]), "", background)
+
+    def _append_text(self, path: Path, text: str, newline, background: bool):
+        if not background:
+            with path.open("a", newline=newline, encoding="utf-8") as f:
+                f.write(text)
+            return
+        if self._write_error is not None:
+            self._raise_write_error()
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer_thread.start()
+        self._write_q.put((path, text, newline))
+
+    def _writer_loop(self):
+        # Auto-save appends land here so slow disks or network shares do not stall the UI thread.
+        while True:
+            path, text, newline = self._write_q.get()
+            try:
+                with path.open("a", newline=newline, encoding="utf-8") as f:
+                    f.write(text)
+            except Exception as e:
+                self._write_error = e
+            finally:
+                self._write_q.task_done()
+
+    def _wait_for_writes(self):
+        if self._writer_thread is not None:
+            self._write_q.join()
+        if self._write_error is not None:
+            self._raise_write_error()
+
+    def _raise_write_error(self):
+        error = self._write_error
+        self._write_error = None
+        raise RuntimeError(f"Auto-save write failed: {error}") from error
 
     def _write_file_header(self):
         if self.output_file.suffix.lower() == ".txt":
@@ -203,23 +393,11 @@ class DataLogger:
                 else:
                     f.write(f"# date={datetime.now().strftime('%Y-%m-%d')}\n")
                 f.write("No_of_pulse\tread_current_A\tread_voltage_V\n")
-            return
-        with self.output_file.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(
-                [
-                    "timestamp",
-                    "voltage",
-                    "current",
-                    "sample_name",
-                    "operator",
-                    "notes",
-                    "elapsed_s",
-                    "cycle_id",
-                    "plot_mode",
-                    "run_description",
-                ]
-            )
+        else:
+            with self.output_file.open("w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(CSV_HEADER)
+        self._header_written = True
 
     def _write_pd_text_file(self):
         self._write_file_header()
@@ -284,5 +462,6 @@ class DataLogger:
             raise RuntimeError("No valid PD measurement rows found in selected TXT file")
         self.rows = loaded
         self.output_file = path
+        self._header_written = True
         self.run_description = run_description
         self._pd_text_existing_count = len(loaded)
@@ -1,27 +1,52 @@
 import os
 import re
 import json
+import logging
 import threading
 import math
+import queue
+import time
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
-from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 
+import numpy as np
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 from matplotlib.ticker import FormatStrFormatter
-from matplotlib import cm
+from matplotlib import colormaps
 
 from connection import KeithleyConnection
 from data_logging import DataLogger
 from plotting import IVPlotter
 
 
+logger = logging.getLogger(__name__)
+
+
 class KeithleyUI:
     SAFE_VOLTAGE_LIMIT = 5.0
     SETTINGS_FILE = "keithley_ui_settings.json"
     WRER_WARN_POINTS = 20000
+    LIVE_DRAIN_MS = 33
+    SETTINGS_SAVE_DEBOUNCE_MS = 500
+    IO_POLL_MS = 50
+    PROGRESS_MIN_INTERVAL_S = 0.1
+    PLOT_REPAINT_MS = 50
+    LIVE_QUEUE_MAX = 8192
+    _PD_FILENAME_UNSAFE_RE = re.compile(r'[<>:"/\\|?*\s]+')
+    _SLUG_UNSAFE_RE = re.compile(r"[^A-Za-z0-9_-]+")
+    _CYCLE_COLORS = tuple(colormaps["tab20"](i) for i in range(20))
+    # Only one embedded IV axes exists at a time, so the tick formatters can be shared.
+    _X_LINEAR_FORMATTER = FormatStrFormatter("%.6g")
+    _Y_LINEAR_FORMATTER = FormatStrFormatter("%.4e")
+    # (execution mode, fast limit) -> (minimum point delay in s, text for the error message)
+    _MIN_DELAY_TABLE = {
+        ("Fast TSP (instrument timing)", "500 ns"): (5e-7, "500 ns"),
+        ("Fast TSP (instrument timing)", "1 ms"): (1e-3, "0.001 s"),
+    }
+    _MIN_DELAY_DEFAULT = (1e-2, "0.010 s")
 
     def __init__(self, root: tk.Tk):
         self.root = root
@@ -38,11 +63,37 @@ class KeithleyUI:
         self.autosave_enabled = False
         self.live_after_id = None
         self.sweep_after_id = None
+        self._settings_after_id = None
+        self._last_settings_text = None
+        self._btn_state_cache = {}
+        self._io_thread = None
+        self._last_progress_t = 0.0
+        self._last_status_t = 0.0
+        self._status_pending = None
+        self._progress_pending = None
         self._sweep_values = []
         self._sweep_index = 0
         self._sweep_start_time = None
         self.last_voltage = 0.0
         self.max_live_points = 5000
+        # Fixed-size ring buffer holding the live trace for plotting.
+        self._rb_v = np.empty(self.max_live_points, dtype=np.float64)
+        self._rb_i = np.empty_like(self._rb_v)
+        self._rb_head = 0
+        self._rb_count = 0
+        self._live_line = None
+        self._blit_bg = None
+        self._cycle_lines = {}
+        self._wrer_lines = None
+        self._frames_since_draw = 0
+        self._plot_refresh_after_id = None
+        self._live_thread = None
+        self._live_stop_event = None
+        self._live_sample_q = None
+        self._live_interval_s = 0.5
+        self._sweep_thread = None
+        self._sweep_stop_event = None
+        self._sweep_result_q = None
         self.custom_segments = []
         self.row_cycle_ids = []
         self.row_time_s = []
@@ -73,6 +124,7 @@ class KeithleyUI:
         self._build_ui()
         self._bind_shortcuts()
         self._load_ui_settings()
+        self._prefetch_save_dir()
         self._update_button_states()
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         # self.root.after(250, self._run_startup_prereq_check)
@@ -122,15 +174,15 @@ class KeithleyUI:
         axis_bar = ttk.Frame(plot_panel)
         axis_bar.grid(row=0, column=0, sticky="ew", pady=(0, 6))
         ttk.Label(axis_bar, text="X Axis").grid(row=0, column=0, sticky="w")
-        self.x_axis_scale_combo = ttk.Combobox(axis_bar, values=["Linear", "Log"], state="readonly", width=10)
+        self.x_axis_scale_combo = self._make_combo(axis_bar, ["Linear", "Log"], state="readonly", width=10)
         self.x_axis_scale_combo.set("Linear")
         self.x_axis_scale_combo.grid(row=0, column=1, sticky="w", padx=(6, 16))
-        self.x_axis_scale_combo.bind("<<ComboboxSelected>>", lambda _event: self._refresh_embedded_plot())
+        self.x_axis_scale_combo.bind("<<ComboboxSelected>>", lambda _event: self._on_axis_scale_changed())
         ttk.Label(axis_bar, text="Y Axis").grid(row=0, column=2, sticky="w")
-        self.y_axis_scale_combo = ttk.Combobox(axis_bar, values=["Linear", "Log"], state="readonly", width=10)
+        self.y_axis_scale_combo = self._make_combo(axis_bar, ["Linear", "Log"], state="readonly", width=10)
         self.y_axis_scale_combo.set("Linear")
         self.y_axis_scale_combo.grid(row=0, column=3, sticky="w", padx=(6, 0))
-        self.y_axis_scale_combo.bind("<<ComboboxSelected>>", lambda _event: self._refresh_embedded_plot())
+        self.y_axis_scale_combo.bind("<<ComboboxSelected>>", lambda _event: self._on_axis_scale_changed())
 
         self.figure = Figure(figsize=(7.5, 5), dpi=100)
         self.ax = self.figure.add_subplot(111)
@@ -140,6 +192,7 @@ class KeithleyUI:
         self.ax.grid(True)
         self.canvas = FigureCanvasTkAgg(self.figure, master=plot_panel)
         self.canvas.get_tk_widget().grid(row=1, column=0, sticky="nsew")
+        self.canvas.mpl_connect("draw_event", self._on_canvas_draw)
 
         status_bar = ttk.Frame(self.root, padding=(12, 6))
         status_bar.grid(row=1, column=0, columnspan=2, sticky="ew")
@@ -206,9 +259,10 @@ class KeithleyUI:
         frame.columnconfigure(1, weight=1)
 
         ttk.Label(frame, text="Sample Rate (ms)").grid(row=0, column=0, sticky="w")
-        self.sample_rate = ttk.Combobox(frame, values=["100", "250", "500", "1000"], width=10, state="readonly")
+        self.sample_rate = self._make_combo(frame, ["100", "250", "500", "1000"], width=10, state="readonly")
         self.sample_rate.set("500")
         self.sample_rate.grid(row=0, column=1, sticky="w")
+        self.sample_rate.bind("<<ComboboxSelected>>", self._on_sample_rate_changed)
 
         self.start_live_btn = ttk.Button(frame, text="Start Live", command=self.start_live_measurement)
         self.start_live_btn.grid(row=1, column=0, sticky="ew", pady=(8, 0), padx=(0, 4))
@@ -264,10 +318,10 @@ class KeithleyUI:
         self.pd_electrode_no_entry.grid(row=6, column=1, sticky="ew")
 
         ttk.Label(common, text="Execution").grid(row=7, column=0, sticky="w")
-        self.sweep_exec_combo = ttk.Combobox(
+        self.sweep_exec_combo = self._make_combo(
             common,
+            ["Host (UI timing)", "Fast TSP (instrument timing)"],
             state="readonly",
-            values=["Host (UI timing)", "Fast TSP (instrument timing)"],
         )
         self.sweep_exec_combo.set("Host (UI timing)")
         self.sweep_exec_combo.grid(row=7, column=1, sticky="ew")
@@ -275,13 +329,18 @@ class KeithleyUI:
 
         self.fast_limit_label = ttk.Label(common, text="Fast Limit")
         self.fast_limit_label.grid(row=8, column=0, sticky="w")
-        self.fast_limit_combo = ttk.Combobox(
+        self.fast_limit_combo = self._make_combo(
             common,
+            ["1 ms", "500 ns"],
             state="readonly",
-            values=["1 ms", "500 ns"],
         )
         self.fast_limit_combo.set("1 ms")
         self.fast_limit_combo.grid(row=8, column=1, sticky="ew")
+        # Read by host-timed sweeps and PD runs; live mode repaints every drain.
+        ttk.Label(common, text="Plot Every N Points").grid(row=9, column=0, sticky="w")
+        self.plot_every_spin = ttk.Spinbox(common, from_=1, to=100, increment=1, width=8)
+        self.plot_every_spin.set("5")
+        self.plot_every_spin.grid(row=9, column=1, sticky="w", pady=(4, 0))
         self._on_sweep_exec_change()
 
         sweep_tabs = ttk.Notebook(frame)
@@ -302,15 +361,15 @@ class KeithleyUI:
         self.sweep_subtabs.bind("<<NotebookTabChanged>>", self._on_sweep_subtab_changed)
 
         ttk.Label(standard_tab, text="Preset").grid(row=0, column=0, sticky="w")
-        self.preset_combo = ttk.Combobox(
+        self.preset_combo = self._make_combo(
             standard_tab,
-            state="readonly",
-            values=[
+            [
                 "Custom",
                 "0 to 1 by 0.1",
                 "0 to 5 by 0.5",
                 "-1 to 1 by 0.1",
             ],
+            state="readonly",
         )
         self.preset_combo.set("Custom")
         self.preset_combo.grid(row=0, column=1, sticky="ew")
@@ -327,10 +386,10 @@ class KeithleyUI:
         self.sweep_stop_entry.grid(row=2, column=1, sticky="ew")
 
         ttk.Label(standard_tab, text="Mode").grid(row=3, column=0, sticky="w")
-        self.sweep_mode_combo = ttk.Combobox(
+        self.sweep_mode_combo = self._make_combo(
             standard_tab,
+            ["One-way", "Simple Cycle (0->+V->0->-V->0)"],
             state="readonly",
-            values=["One-way", "Simple Cycle (0->+V->0->-V->0)"],
         )
         self.sweep_mode_combo.set("Simple Cycle (0->+V->0->-V->0)")
         self.sweep_mode_combo.grid(row=3, column=1, sticky="ew")
@@ -528,6 +587,9 @@ class KeithleyUI:
         ttk.Label(frame, text="Notes").grid(row=2, column=0, sticky="w")
         self.notes_entry = ttk.Entry(frame)
         self.notes_entry.grid(row=2, column=1, sticky="ew")
+        for entry in (self.sample_entry, self.operator_entry, self.notes_entry):
+            entry.bind("<FocusOut>", self._on_metadata_edited)
+            entry.bind("<Return>", self._on_metadata_edited)
 
         ttk.Label(frame, textvariable=self.autosave_text).grid(row=3, column=0, columnspan=2, sticky="w", pady=(6, 0))
         ttk.Label(frame, textvariable=self.save_path_text, wraplength=340).grid(
@@ -565,16 +627,28 @@ class KeithleyUI:
             return Path(self.SETTINGS_FILE)
 
     def _set_entry_value(self, entry, value):
+        text = str(value)
+        if entry.get() == text:
+            return
         entry.delete(0, tk.END)
-        entry.insert(0, str(value))
+        entry.insert(0, text)
+
+    @staticmethod
+    def _make_combo(parent, values, **kwargs):
+        combo = ttk.Combobox(parent, values=values, **kwargs)
+        # Choices are fixed at construction; keep them Python-side to avoid Tcl lookups.
+        combo._valid_set = frozenset(values)
+        return combo
 
     def _set_combo_if_valid(self, combo, value):
-        values = list(combo.cget("values"))
-        if value in values:
+        valid = getattr(combo, "_valid_set", None)
+        if valid is None:
+            valid = combo.cget("values")
+        if isinstance(value, str) and value in valid:
             combo.set(value)
 
     def _load_ui_settings(self):
-        path = self._settings_path()
+        primary_path = path = self._settings_path()
         if not path.exists():
             legacy_path = Path(self.SETTINGS_FILE)
             if legacy_path.exists():
@@ -582,9 +656,14 @@ class KeithleyUI:
         if not path.exists():
             return
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            raw = path.read_bytes()
+            data = json.loads(raw)
         except Exception:
             return
+        if path == primary_path:
+            # Lets an unchanged session skip rewriting the file on close.
+            # Older saves were written with platform newlines (CRLF on Windows); compare against LF json.dumps text.
+            self._last_settings_text = raw.decode("utf-8", errors="replace").replace("\r\n", "\n")
 
         entry_map = {
             "voltage": self.voltage_entry,
@@ -624,10 +703,12 @@ class KeithleyUI:
             "sample_name": self.sample_entry,
             "operator": self.operator_entry,
             "notes": self.notes_entry,
+            "plot_refresh_every_n": self.plot_every_spin,
         }
-        for key, widget in entry_map.items():
-            if key in data:
-                self._set_entry_value(widget, data[key])
+        for key, value in data.items():
+            widget = entry_map.get(key)
+            if widget is not None:
+                self._set_entry_value(widget, value)
 
         self._set_combo_if_valid(self.sample_rate, data.get("sample_rate_ms"))
         self._set_combo_if_valid(self.preset_combo, data.get("preset"))
@@ -645,7 +726,8 @@ class KeithleyUI:
         self._on_sweep_exec_change()
 
         preferred_save_dir = data.get("preferred_save_dir")
-        if isinstance(preferred_save_dir, str) and preferred_save_dir and os.path.isdir(preferred_save_dir):
+        # Accepted as-is; existence is checked lazily in _resolve_save_dir so a slow network share can't stall startup.
+        if isinstance(preferred_save_dir, str) and preferred_save_dir:
             self.preferred_save_dir = preferred_save_dir
             self.save_dir_text.set(f"Save folder: {self.preferred_save_dir}")
 
@@ -684,6 +766,10 @@ class KeithleyUI:
         self._on_sweep_subtab_changed()
 
     def _save_ui_settings(self):
+        pending = getattr(self, "_settings_after_id", None)
+        if pending:
+            self.root.after_cancel(pending)
+            self._settings_after_id = None
         data = {
             "voltage": self.voltage_entry.get(),
             "compliance_ua": self.compliance_entry.get(),
@@ -723,6 +809,7 @@ class KeithleyUI:
             "operator": self.operator_entry.get(),
             "notes": self.notes_entry.get(),
             "sample_rate_ms": self.sample_rate.get(),
+            "plot_refresh_every_n": self.plot_every_spin.get(),
             "preset": self.preset_combo.get(),
             "sweep_mode": self.sweep_mode_combo.get(),
             "sweep_exec": self.sweep_exec_combo.get(),
@@ -737,11 +824,24 @@ class KeithleyUI:
             "preferred_save_dir": self.preferred_save_dir,
             "window_geometry": self.root.winfo_geometry(),
         }
+        text = json.dumps(data, indent=2)
+        if text == getattr(self, "_last_settings_text", None):
+            return
         try:
-            self._settings_path().write_text(json.dumps(data, indent=2), encoding="utf-8")
+            self._settings_path().write_text(text, encoding="utf-8", newline="\n")
+            self._last_settings_text = text
         except Exception:
             pass
 
+    def _schedule_save_ui_settings(self):
+        if self._settings_after_id:
+            self.root.after_cancel(self._settings_after_id)
+        self._settings_after_id = self.root.after(self.SETTINGS_SAVE_DEBOUNCE_MS, self._run_scheduled_settings_save)
+
+    def _run_scheduled_settings_save(self):
+        self._settings_after_id = None
+        self._save_ui_settings()
+
     def _bind_shortcuts(self):
         self.root.bind("<Control-s>", lambda _event: self.save_csv_manual())
         self.root.bind("<F5>", lambda _event: self.run_sweep_from_inputs())
@@ -754,26 +854,37 @@ class KeithleyUI:
         preview_state = "disabled" if (self.live_running or self.sweep_running) else "normal"
         stop_state = "normal" if self.live_running or self.sweep_running else "disabled"
 
-        self.apply_voltage_btn.config(state=idle_connected_state)
-        self.measure_btn.config(state=idle_connected_state)
-        self.apply_compliance_btn.config(state=idle_connected_state)
-        self.start_live_btn.config(state=live_state)
-        self.run_sweep_btn.config(state=live_state)
-        self.run_custom_sweep_btn.config(state=live_state)
-        self.run_wrer_btn.config(state=live_state)
-        self.run_pd_btn.config(state=live_state)
-        self.preview_wrer_btn.config(state=preview_state)
-        self.preview_pd_btn.config(state=preview_state)
-        self.sweep_stop_btn.config(state=stop_state)
-        self.stop_btn.config(state=stop_state)
-        self.plot_btn.config(state="normal" if self.logger.rows else "disabled")
-        self.save_btn.config(state="normal" if self.logger.rows else "disabled")
-        self.choose_folder_btn.config(state="normal")
-        self.load_btn.config(state="normal")
-        self.open_folder_btn.config(state="normal")
-        self.clear_data_btn.config(state="normal" if self.logger.rows else "disabled")
-        self.connect_btn.config(state="normal")
-        self.sample_rate.config(state="readonly" if connected_state == "normal" else "disabled")
+        has_rows = "normal" if self.logger.rows else "disabled"
+        states = (
+            (self.apply_voltage_btn, idle_connected_state),
+            (self.measure_btn, idle_connected_state),
+            (self.apply_compliance_btn, idle_connected_state),
+            (self.start_live_btn, live_state),
+            (self.run_sweep_btn, live_state),
+            (self.run_custom_sweep_btn, live_state),
+            (self.run_wrer_btn, live_state),
+            (self.run_pd_btn, live_state),
+            (self.preview_wrer_btn, preview_state),
+            (self.preview_pd_btn, preview_state),
+            (self.sweep_stop_btn, stop_state),
+            (self.stop_btn, stop_state),
+            (self.plot_btn, has_rows),
+            (self.save_btn, has_rows),
+            (self.choose_folder_btn, "normal"),
+            (self.load_btn, "normal"),
+            (self.open_folder_btn, "normal"),
+            (self.clear_data_btn, has_rows),
+            (self.connect_btn, "normal"),
+            (self.sample_rate, "readonly" if connected_state == "normal" else "disabled"),
+        )
+        # Only touch widgets whose state actually changed; each config() is a Tcl round-trip.
+        cache = getattr(self, "_btn_state_cache", None)
+        if cache is None:
+            cache = self._btn_state_cache = {}
+        for widget, state in states:
+            if cache.get(widget) != state:
+                widget.config(state=state)
+                cache[widget] = state
 
     def _annotate_last_row(self, cycle_id=0, point_t=None):
         if not self.logger.rows:
@@ -784,16 +895,47 @@ class KeithleyUI:
         active_mode = getattr(self, "active_plot_mode", "iv")
         row.plot_mode = active_mode if active_mode in ("iv", "wrer", "pd") else "iv"
 
+    def _run_io_task(self, work, on_done):
+        # VISA enumeration/open can block for seconds; run it off the Tk thread and poll for the result.
+        state = {}
+
+        def _worker():
+            try:
+                state["result"] = work()
+            except Exception as e:
+                state["error"] = e
+
+        self._io_thread = threading.Thread(target=_worker, daemon=True)
+        self._io_thread.start()
+        self.root.after(self.IO_POLL_MS, self._poll_io_task, self._io_thread, state, on_done)
+
+    def _poll_io_task(self, thread, state, on_done):
+        if getattr(self, "_closing", False):
+            return
+        if thread.is_alive():
+            self.root.after(self.IO_POLL_MS, self._poll_io_task, thread, state, on_done)
+            return
+        self._io_thread = None
+        on_done(state.get("result"), state.get("error"))
+
+    def _io_busy(self):
+        thread = getattr(self, "_io_thread", None)
+        return thread is not None and thread.is_alive()
+
     def detect(self):
+        if self._io_busy():
+            return
         self.listbox.delete(0, tk.END)
-        try:
-            devices = self.connection.list_devices()
-            for device in devices:
-                self.listbox.insert(tk.END, device)
-            if not devices:
-                messagebox.showinfo("Detect", "No VISA devices found")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        self._run_io_task(self.connection.list_devices, self._on_detect_done)
+
+    def _on_detect_done(self, devices, error):
+        if error is not None:
+            messagebox.showerror("Error", str(error))
+            return
+        if devices:
+            self.listbox.insert(tk.END, *devices)
+        else:
+            messagebox.showinfo("Detect", "No VISA devices found")
 
     def _run_startup_prereq_check(self):
         self.show_prereq_check(silent_if_ok=True)
@@ -841,21 +983,26 @@ class KeithleyUI:
         if not selection:
             messagebox.showerror("Error", "Select a device from the list first")
             return
-        try:
-            resource = self.listbox.get(selection[0])
-            idn = self.connection.connect(resource)
+        if self._io_busy():
+            return
+        resource = self.listbox.get(selection[0])
+        self.status_text.set(f"Connecting to {resource}...")
+        self._run_io_task(lambda: self.connection.connect(resource), self._on_connect_done)
+
+    def _on_connect_done(self, idn, error):
+        if error is None:
             self.connected = True
             self.connection_text.set("Connected")
             self.device_text.set(f"Device: {self.connection.last_resource}")
             self.status_text.set(f"Ready ({self.connection.mode.upper()}) {idn}")
             self.instrument_info_text.set(f"Instrument: {idn} | Mode: {self.connection.mode.upper()}")
             self._update_button_states()
-        except Exception as e:
-            self.connected = False
-            self.connection_text.set("Disconnected")
-            self.status_text.set("Connection failed")
-            self.instrument_info_text.set("Instrument: Not connected")
-            messagebox.showerror("Error", str(e))
+            return
+        self.connected = False
+        self.connection_text.set("Disconnected")
+        self.status_text.set("Connection failed")
+        self.instrument_info_text.set("Instrument: Not connected")
+        messagebox.showerror("Error", str(error))
 
     def apply_compliance(self):
         try:
@@ -900,57 +1047,237 @@ class KeithleyUI:
             messagebox.showerror("Error", str(e))
 
     def measure(self):
+        if self._io_busy():
+            return
+        self._run_io_task(self.connection.measure_current, self._on_measure_done)
+
+    def _on_measure_done(self, current, error):
+        if error is not None:
+            messagebox.showerror("Error", str(error))
+            return
         try:
             self._sync_metadata()
             self.logger.set_run_description("")
-            current = self.connection.measure_current()
             self.active_plot_mode = "iv"
             self._last_run_mode = "iv"
             self.logger.add(self.last_voltage, current, auto_save=self.autosave_enabled and self.logger.output_file is not None)
             self.row_cycle_ids.append(0)
             self.row_time_s.append(None)
             self._annotate_last_row(cycle_id=0, point_t=None)
+            self.logger.flush()
             self.status_text.set(f"I={current:.6e} A @ V={self.last_voltage:.6g} V")
-            self._refresh_embedded_plot()
+            self._request_plot_refresh()
             self._update_button_states()
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
     def start_live_measurement(self):
+        self._sync_metadata()
+        self._rb_reset()
         self.live_running = True
         self.status_text.set("Live measurement running")
         self._update_button_states()
-        self._run_live_measurement_step()
+        # The instrument is polled on a worker thread; the Tk loop only drains samples and blits.
+        self._live_interval_s = int(self.sample_rate.get()) / 1000.0
+        self._live_stop_event = threading.Event()
+        self._live_sample_q = queue.Queue(maxsize=self.LIVE_QUEUE_MAX)
+        self._live_dropped = 0
+        self._live_thread = threading.Thread(
+            target=self._live_worker,
+            args=(self._live_stop_event, self._live_sample_q),
+            daemon=True,
+        )
+        self._live_thread.start()
+        self.live_after_id = self.root.after(self.LIVE_DRAIN_MS, self._drain_live_samples)
+
+    def _on_sample_rate_changed(self, _event=None):
+        # The live worker reads this each sample; refresh it only when the user picks a new rate.
+        self._live_interval_s = int(self.sample_rate.get()) / 1000.0
 
-    def _run_live_measurement_step(self):
+    def _live_worker(self, stop_event, sample_q):
+        while not stop_event.is_set():
+            started = time.monotonic()
+            try:
+                current = self.connection.measure_current()
+            except Exception as e:
+                # The queue is bounded; never block on it, or a UI that stopped draining would strand this thread.
+                while not stop_event.is_set():
+                    try:
+                        sample_q.put((None, e), timeout=0.1)
+                        break
+                    except queue.Full:
+                        pass
+                return
+            try:
+                sample_q.put_nowait((current, None))
+            except queue.Full:
+                # Drop rather than let a stalled UI grow the queue. Dropped samples never reach logger.rows,
+                # so Save CSV misses them too; the count is shown in the live status line.
+                self._live_dropped += 1
+            stop_event.wait(max(0.0, self._live_interval_s - (time.monotonic() - started)))
+
+    def _stop_live_worker(self, join_timeout_s=0.0):
+        stop_event = getattr(self, "_live_stop_event", None)
+        if stop_event is not None:
+            stop_event.set()
+        thread = getattr(self, "_live_thread", None)
+        if join_timeout_s and thread is not None and thread.is_alive():
+            thread.join(timeout=join_timeout_s)
+
+    def _drain_live_samples(self):
         if not self.live_running:
             self.live_after_id = None
             return
+        samples = []
+        error = None
         try:
-            self._sync_metadata()
-            self.logger.set_run_description("")
-            current = self.connection.measure_current()
-            self.active_plot_mode = "iv"
-            self._last_run_mode = "iv"
-            self.logger.add(self.last_voltage, current, auto_save=False)
-            self.row_cycle_ids.append(0)
-            self.row_time_s.append(None)
-            self._annotate_last_row(cycle_id=0, point_t=None)
-            if len(self.logger.rows) > self.max_live_points:
-                self.logger.rows = self.logger.rows[-self.max_live_points:]
-                self.row_cycle_ids = self.row_cycle_ids[-self.max_live_points:]
-                self.row_time_s = self.row_time_s[-self.max_live_points:]
-            self.status_text.set(f"Live: I={current:.6e} A @ V={self.last_voltage:.6g} V")
-            self._refresh_embedded_plot()
-            interval_ms = int(self.sample_rate.get())
-            self.live_after_id = self.root.after(interval_ms, self._run_live_measurement_step)
-            self._update_button_states()
+            while True:
+                current, error = self._live_sample_q.get_nowait()
+                if error is not None:
+                    break
+                samples.append(current)
+        except queue.Empty:
+            pass
+        try:
+            if samples:
+                had_rows = bool(self.logger.rows)
+                self.logger.set_run_description("")
+                self.active_plot_mode = "iv"
+                self._last_run_mode = "iv"
+                voltage = self.last_voltage
+                for current in samples:
+                    self.logger.add(voltage, current, auto_save=False)
+                    self.row_cycle_ids.append(0)
+                    self.row_time_s.append(None)
+                    self._annotate_last_row(cycle_id=0, point_t=None)
+                    self._rb_push(voltage, current)
+                if len(self.logger.rows) > self.max_live_points:
+                    self.logger.trim_to(self.max_live_points)
+                    del self.row_cycle_ids[:-self.max_live_points]
+                    del self.row_time_s[:-self.max_live_points]
+                dropped = getattr(self, "_live_dropped", 0)
+                if dropped:
+                    self._set_status_throttled(
+                        "Live: I={:.6e} A @ V={:.6g} V | dropped {}", samples[-1], voltage, dropped
+                    )
+                else:
+                    self._set_status_throttled("Live: I={:.6e} A @ V={:.6g} V", samples[-1], voltage)
+                self._update_live_plot()
+                if not had_rows:
+                    # Only the first samples change button states (Plot/Save/Clear need rows).
+                    self._update_button_states()
+            if error is not None:
+                raise error
+            self.live_after_id = self.root.after(self.LIVE_DRAIN_MS, self._drain_live_samples)
         except Exception as e:
             self.live_running = False
             self.live_after_id = None
+            self._stop_live_worker()
             self._update_button_states()
             messagebox.showerror("Error", str(e))
 
+    def _rb_reset(self):
+        if len(self._rb_v) != self.max_live_points:
+            self._rb_v = np.empty(self.max_live_points, dtype=np.float64)
+            self._rb_i = np.empty_like(self._rb_v)
+        self._rb_head = 0
+        self._rb_count = 0
+
+    def _rb_push(self, voltage, current):
+        size = len(self._rb_v)
+        self._rb_v[self._rb_head] = voltage
+        self._rb_i[self._rb_head] = current
+        self._rb_head = (self._rb_head + 1) % size
+        if self._rb_count < size:
+            self._rb_count += 1
+
+    def _rb_view(self):
+        # Oldest-to-newest; only a wrapped buffer needs a copy.
+        count = self._rb_count
+        if count < len(self._rb_v) or self._rb_head == 0:
+            return self._rb_v[:count], self._rb_i[:count]
+        head = self._rb_head
+        return (
+            np.concatenate((self._rb_v[head:], self._rb_v[:head])),
+            np.concatenate((self._rb_i[head:], self._rb_i[:head])),
+        )
+
+    def _live_tail_count(self):
+        # While live runs, the newest rows are drawn from the ring buffer instead of the static series.
+        if not getattr(self, "live_running", False):
+            return 0
+        return min(getattr(self, "_rb_count", 0), len(self.logger.rows))
+
+    def _live_plot_data(self, xscale, yscale):
+        voltages, currents = self._rb_view()
+        if yscale == "log":
+            currents = np.abs(currents)
+            mask = currents != 0
+            if xscale == "log":
+                mask &= voltages > 0
+            return voltages[mask], currents[mask]
+        if xscale == "log":
+            mask = voltages > 0
+            return voltages[mask], currents[mask]
+        return voltages, currents
+
+    def _on_canvas_draw(self, _event):
+        # Every full draw (refresh, resize, scale change) re-captures the background under the live line.
+        line = self._live_line
+        if line is None or self.ax is None or line.axes is not self.ax:
+            self._blit_bg = None
+            return
+        self._blit_bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(line)
+
+    def _update_live_plot(self):
+        line = self._live_line
+        if line is None or self._blit_bg is None or self.ax is None or line.axes is not self.ax:
+            self._refresh_embedded_plot()
+            return
+        xscale, yscale = self._get_axis_scales()
+        live_x, live_y = self._live_plot_data(xscale, yscale)
+        line.set_data(live_x, live_y)
+        if len(live_x):
+            x_min, x_max = sorted(self.ax.get_xlim())
+            y_min, y_max = sorted(self.ax.get_ylim())
+            if not (x_min <= live_x[-1] <= x_max and y_min <= live_y[-1] <= y_max):
+                # New sample is off-screen: rescale and let the draw_event handler re-capture the
+                # grid/labels background, without rebuilding the plotted artists.
+                self.ax.relim()
+                self.ax.autoscale_view()
+                self.canvas.draw_idle()
+                return
+        self.canvas.restore_region(self._blit_bg)
+        self.ax.draw_artist(line)
+        self.canvas.blit(self.ax.bbox)
+
+    def _resolve_min_delay(self, sweep_exec):
+        if sweep_exec == "Fast TSP (instrument timing)":
+            limit = "500 ns" if self.fast_limit_combo.get() == "500 ns" else "1 ms"
+            return self._MIN_DELAY_TABLE[(sweep_exec, limit)]
+        return self._MIN_DELAY_DEFAULT
+
+    def _check_min_delay(self, delay, sweep_exec):
+        min_delay, min_text = self._resolve_min_delay(sweep_exec)
+        if delay >= min_delay:
+            return True
+        messagebox.showerror("Error", f"Delay must be at least {min_text}")
+        return False
+
+    def _confirm_voltages(self, values, limit_msg, warn_msg, question="Continue?"):
+        max_abs = self.connection.MAX_ABS_VOLTAGE
+        peak = max(map(abs, values), default=0.0)
+        if peak > max_abs:
+            messagebox.showerror("Error", f"{limit_msg} within +/-{max_abs:g} V")
+            return False
+        if peak > self.SAFE_VOLTAGE_LIMIT:
+            return messagebox.askyesno(
+                "High Voltage Warning",
+                f"{warn_msg} above {self.SAFE_VOLTAGE_LIMIT:g} V.\n{question}",
+            )
+        return True
+
     def preview_wrer(self):
         try:
             delay = float(self.sweep_delay_entry.get())
@@ -969,19 +1296,8 @@ class KeithleyUI:
             messagebox.showerror("Error", "Invalid time/cycle parameters")
             return
         voltages_to_check = [write_v, read_v, erase_v]
-        if any(abs(v) > self.connection.MAX_ABS_VOLTAGE for v in voltages_to_check):
-            messagebox.showerror(
-                "Error",
-                f"WRER voltages must be within +/-{self.connection.MAX_ABS_VOLTAGE:g} V",
-            )
+        if not self._confirm_voltages(voltages_to_check, "WRER voltages must be", "WRER includes voltage", "Continue preview?"):
             return
-        if max(abs(v) for v in voltages_to_check) > self.SAFE_VOLTAGE_LIMIT:
-            proceed = messagebox.askyesno(
-                "High Voltage Warning",
-                f"WRER includes voltage above {self.SAFE_VOLTAGE_LIMIT:g} V.\nContinue preview?",
-            )
-            if not proceed:
-                return
         total_points = self._estimate_wrer_total_points(write_t, read_t, erase_t, delay, cycles)
         if not self._confirm_large_wrer_sequence(total_points, action="Preview"):
             return
@@ -1071,19 +1387,7 @@ class KeithleyUI:
         if step == 0:
             messagebox.showerror("Error", "Sweep step cannot be zero")
             return
-        fast_limit = self.fast_limit_combo.get()
-        if sweep_exec == "Fast TSP (instrument timing)":
-            min_delay = 5e-7 if fast_limit == "500 ns" else 0.001
-        else:
-            min_delay = 0.01
-        if delay < min_delay:
-            if min_delay < 1e-6:
-                min_text = "500 ns"
-            elif min_delay < 0.001:
-                min_text = f"{min_delay:.1e} s"
-            else:
-                min_text = f"{min_delay:.3f} s"
-            messagebox.showerror("Error", f"Delay must be at least {min_text}")
+        if not self._check_min_delay(delay, sweep_exec):
             return
 
         if sweep_mode == "Simple Cycle (0->+V->0->-V->0)":
@@ -1099,19 +1403,8 @@ class KeithleyUI:
             if cycle_peak < 0:
                 messagebox.showerror("Error", "Cycle Peak V must be >= 0")
                 return
-            if abs(cycle_peak) > self.connection.MAX_ABS_VOLTAGE:
-                messagebox.showerror(
-                    "Error",
-                    f"Cycle peak must be within +/-{self.connection.MAX_ABS_VOLTAGE:g} V",
-                )
+            if not self._confirm_voltages([cycle_peak], "Cycle peak must be", "Cycle peak includes voltage"):
                 return
-            if abs(cycle_peak) > self.SAFE_VOLTAGE_LIMIT:
-                proceed = messagebox.askyesno(
-                    "High Voltage Warning",
-                    f"Cycle peak includes voltage above {self.SAFE_VOLTAGE_LIMIT:g} V.\nContinue?",
-                )
-                if not proceed:
-                    return
             values, cycle_ids = self._build_simple_cycle_values_with_cycles(cycle_peak, step, cycles)
         else:
             try:
@@ -1120,19 +1413,8 @@ class KeithleyUI:
             except ValueError:
                 messagebox.showerror("Error", "Start/Stop must be valid numbers for One-way mode")
                 return
-            if abs(start) > self.connection.MAX_ABS_VOLTAGE or abs(stop) > self.connection.MAX_ABS_VOLTAGE:
-                messagebox.showerror(
-                    "Error",
-                    f"Sweep voltage must be within +/-{self.connection.MAX_ABS_VOLTAGE:g} V",
-                )
+            if not self._confirm_voltages([start, stop], "Sweep voltage must be", "Sweep range includes voltage"):
                 return
-            if max(abs(start), abs(stop)) > self.SAFE_VOLTAGE_LIMIT:
-                proceed = messagebox.askyesno(
-                    "High Voltage Warning",
-                    f"Sweep range includes voltage above {self.SAFE_VOLTAGE_LIMIT:g} V.\nContinue?",
-                )
-                if not proceed:
-                    return
             values = self._build_sweep_values(start, stop, step)
             cycle_ids = [1] * len(values)
         if not values:
@@ -1161,34 +1443,11 @@ class KeithleyUI:
         if seq_cycles < 1:
             messagebox.showerror("Error", "Sequence cycles must be >= 1")
             return
-        fast_limit = self.fast_limit_combo.get()
-        if sweep_exec == "Fast TSP (instrument timing)":
-            min_delay = 5e-7 if fast_limit == "500 ns" else 0.001
-        else:
-            min_delay = 0.01
-        if delay < min_delay:
-            if min_delay < 1e-6:
-                min_text = "500 ns"
-            elif min_delay < 0.001:
-                min_text = f"{min_delay:.1e} s"
-            else:
-                min_text = f"{min_delay:.3f} s"
-            messagebox.showerror("Error", f"Delay must be at least {min_text}")
+        if not self._check_min_delay(delay, sweep_exec):
             return
         endpoints = [v for pair in self.custom_segments for v in pair]
-        if any(abs(v) > self.connection.MAX_ABS_VOLTAGE for v in endpoints):
-            messagebox.showerror(
-                "Error",
-                f"Sequence values must be within +/-{self.connection.MAX_ABS_VOLTAGE:g} V",
-            )
+        if not self._confirm_voltages(endpoints, "Sequence values must be", "Sequence includes voltage"):
             return
-        if max(abs(v) for v in endpoints) > self.SAFE_VOLTAGE_LIMIT:
-            proceed = messagebox.askyesno(
-                "High Voltage Warning",
-                f"Sequence includes voltage above {self.SAFE_VOLTAGE_LIMIT:g} V.\nContinue?",
-            )
-            if not proceed:
-                return
         values, cycle_ids = self._build_custom_sequence_values_with_cycles(step, seq_cycles)
         if not values:
             messagebox.showerror("Error", "Custom sequence produced no points")
@@ -1218,34 +1477,11 @@ class KeithleyUI:
         if write_t <= 0 or read_t <= 0 or erase_t <= 0:
             messagebox.showerror("Error", "Write/Read/Erase time must be > 0")
             return
-        fast_limit = self.fast_limit_combo.get()
-        if sweep_exec == "Fast TSP (instrument timing)":
-            min_delay = 5e-7 if fast_limit == "500 ns" else 0.001
-        else:
-            min_delay = 0.01
-        if delay < min_delay:
-            if min_delay < 1e-6:
-                min_text = "500 ns"
-            elif min_delay < 0.001:
-                min_text = f"{min_delay:.1e} s"
-            else:
-                min_text = f"{min_delay:.3f} s"
-            messagebox.showerror("Error", f"Delay must be at least {min_text}")
+        if not self._check_min_delay(delay, sweep_exec):
             return
         voltages_to_check = [write_v, read_v, erase_v]
-        if any(abs(v) > self.connection.MAX_ABS_VOLTAGE for v in voltages_to_check):
-            messagebox.showerror(
-                "Error",
-                f"WRER voltages must be within +/-{self.connection.MAX_ABS_VOLTAGE:g} V",
-            )
+        if not self._confirm_voltages(voltages_to_check, "WRER voltages must be", "WRER includes voltage"):
             return
-        if max(abs(v) for v in voltages_to_check) > self.SAFE_VOLTAGE_LIMIT:
-            proceed = messagebox.askyesno(
-                "High Voltage Warning",
-                f"WRER includes voltage above {self.SAFE_VOLTAGE_LIMIT:g} V.\nContinue?",
-            )
-            if not proceed:
-                return
         total_points = self._estimate_wrer_total_points(write_t, read_t, erase_t, delay, cycles)
         if not self._confirm_large_wrer_sequence(total_points, action="Run"):
             return
@@ -1262,7 +1498,7 @@ class KeithleyUI:
         if not values:
             messagebox.showerror("Error", "WRER produced no points")
             return
-        point_times = [idx * delay for idx in range(len(values))]
+        point_times = (np.arange(len(values)) * delay).tolist()
         self._start_sweep_run(
             values=values,
             cycle_ids=cycle_ids,
@@ -1322,7 +1558,7 @@ class KeithleyUI:
 
         file_path = filedialog.asksaveasfilename(
             defaultextension=".txt",
-            initialdir=self.preferred_save_dir,
+            initialdir=self._resolve_save_dir(),
             initialfile=self._pd_output_filename(),
             filetypes=[("Text Files", "*.txt"), ("All Files", "*.*")],
             title="Select save file before starting PD run",
@@ -1378,7 +1614,7 @@ class KeithleyUI:
                 self.sweep_running = True
                 self._sweep_values = [step["voltage"] for step in steps]
                 self._sweep_index = 0
-                self._sweep_start_time = datetime.now()
+                self._sweep_start_time = time.perf_counter()
                 self.sweep_progress.config(maximum=len(self._pd_steps), value=0)
                 self.progress_text.set(f"Sweep progress: 0/{len(self._pd_steps)}")
                 self.eta_text.set("Elapsed: 00:00 | ETA: --:--")
@@ -1409,7 +1645,7 @@ class KeithleyUI:
     def _start_sweep_run(self, values, cycle_ids, delay, sweep_exec, plot_mode="iv", point_times=None):
         file_path = filedialog.asksaveasfilename(
             defaultextension=".csv",
-            initialdir=self.preferred_save_dir,
+            initialdir=self._resolve_save_dir(),
             initialfile=self._default_data_filename(),
             filetypes=[("CSV Files", "*.csv"), ("All Files", "*.*")],
             title="Select save file before starting sweep",
@@ -1467,6 +1703,8 @@ class KeithleyUI:
             self.fast_limit_combo.grid_remove()
 
     def _on_sweep_subtab_changed(self, _event=None):
+        if _event is not None:
+            self._schedule_save_ui_settings()
         if not hasattr(self, "sweep_subtabs"):
             return
         has_pd_compliance = hasattr(self, "pd_compliance_label") and hasattr(self, "pd_compliance_entry")
@@ -1523,6 +1761,7 @@ class KeithleyUI:
             return
         self.custom_segments.append((start_v, end_v))
         self._refresh_sequence_list()
+        self._schedule_save_ui_settings()
 
     def _update_sequence_segment(self):
         idx = self._get_selected_segment_index()
@@ -1537,6 +1776,7 @@ class KeithleyUI:
             return
         self.custom_segments[idx] = (start_v, end_v)
         self._refresh_sequence_list()
+        self._schedule_save_ui_settings()
         self.segment_listbox.selection_set(idx)
         self.segment_listbox.activate(idx)
 
@@ -1547,6 +1787,7 @@ class KeithleyUI:
             return
         del self.custom_segments[idx]
         self._refresh_sequence_list()
+        self._schedule_save_ui_settings()
         if self.custom_segments:
             new_idx = min(idx, len(self.custom_segments) - 1)
             self.segment_listbox.selection_set(new_idx)
@@ -1556,6 +1797,7 @@ class KeithleyUI:
     def _reset_sequence_segments(self):
         self.custom_segments.clear()
         self._refresh_sequence_list()
+        self._schedule_save_ui_settings()
 
     def _get_selected_segment_index(self):
         selected = self.segment_listbox.curselection()
@@ -1578,42 +1820,45 @@ class KeithleyUI:
 
     def _refresh_sequence_list(self):
         self.segment_listbox.delete(0, tk.END)
-        for idx, (a, b) in enumerate(self.custom_segments, start=1):
-            self.segment_listbox.insert(tk.END, f"{idx}. {a:g} -> {b:g}")
+        labels = [f"{idx}. {a:g} -> {b:g}" for idx, (a, b) in enumerate(self.custom_segments, start=1)]
+        if labels:
+            self.segment_listbox.insert(tk.END, *labels)
 
     def _build_custom_sequence_values_with_cycles(self, step: float, cycles: int):
         step_mag = abs(step)
         if step_mag == 0 or cycles < 1 or not self.custom_segments:
             return [], []
-        single = []
+        pieces = []
         for idx, (a, b) in enumerate(self.custom_segments):
             if a == b:
-                seg = [round(a, 12)]
+                seg = np.array([round(a, 12)])
             else:
                 signed = step_mag if b > a else -step_mag
-                seg = self._build_sweep_values(a, b, signed)
-            if not seg:
+                seg = self._sweep_array(a, b, signed)
+            if not seg.size:
                 return [], []
             # Skip the first point of later segments only when it duplicates the
             # previous segment's end point. Single-point segments must be kept.
-            if idx == 0 or single[-1] != seg[0]:
-                single.extend(seg)
-            else:
-                single.extend(seg[1:])
-        values = list(single)
-        cycle_ids = [1] * len(single)
-        for cycle_idx in range(2, cycles + 1):
-            repeat_points = single if values[-1] != single[0] else single[1:]
-            values.extend(repeat_points)
-            cycle_ids.extend([cycle_idx] * len(repeat_points))
-        return values, cycle_ids
+            pieces.append(seg[1:] if idx > 0 and prev_end == seg[0] else seg)
+            prev_end = seg[-1]
+        single = np.concatenate(pieces)
+        # Every repeat ends on single[-1], so whether the join point is dropped is the same for all cycles.
+        repeat_points = single[1:] if single[-1] == single[0] else single
+        values = np.concatenate((single, np.tile(repeat_points, cycles - 1)))
+        cycle_ids = np.concatenate(
+            (
+                np.ones(len(single), dtype=np.int64),
+                np.repeat(np.arange(2, cycles + 1, dtype=np.int64), len(repeat_points)),
+            )
+        )
+        return values.tolist(), cycle_ids.tolist()
 
     @staticmethod
     def _build_hold_values(voltage: float, hold_time_s: float, sample_interval_s: float):
         if hold_time_s <= 0 or sample_interval_s <= 0:
-            return []
+            return np.empty(0)
         points = max(1, int(round(hold_time_s / sample_interval_s)))
-        return [round(voltage, 12)] * points
+        return np.full(points, round(voltage, 12))
 
     @classmethod
     def _build_wrer_values_with_cycles(
@@ -1629,19 +1874,19 @@ class KeithleyUI:
     ):
         if cycles < 1:
             return [], []
-        single = []
-        single.extend(cls._build_hold_values(write_v, write_t, sample_interval_s))
-        single.extend(cls._build_hold_values(read_v, read_t, sample_interval_s))
-        single.extend(cls._build_hold_values(erase_v, erase_t, sample_interval_s))
-        single.extend(cls._build_hold_values(read_v, read_t, sample_interval_s))
-        if not single:
+        single = np.concatenate(
+            [
+                cls._build_hold_values(write_v, write_t, sample_interval_s),
+                cls._build_hold_values(read_v, read_t, sample_interval_s),
+                cls._build_hold_values(erase_v, erase_t, sample_interval_s),
+                cls._build_hold_values(read_v, read_t, sample_interval_s),
+            ]
+        )
+        if not single.size:
             return [], []
-        values = list(single)
-        cycle_ids = [1] * len(single)
-        for cycle_idx in range(2, cycles + 1):
-            values.extend(single)
-            cycle_ids.extend([cycle_idx] * len(single))
-        return values, cycle_ids
+        values = np.tile(single, cycles)
+        cycle_ids = np.repeat(np.arange(1, cycles + 1), single.size)
+        return values.tolist(), cycle_ids.tolist()
 
     @staticmethod
     def _estimate_hold_points(hold_time_s: float, sample_interval_s: float):
@@ -1722,19 +1967,10 @@ class KeithleyUI:
             return None
 
         voltages_to_check = [pot_v, read_v, dep_v]
-        if any(abs(v) > self.connection.MAX_ABS_VOLTAGE for v in voltages_to_check):
-            messagebox.showerror(
-                "Error",
-                f"PD voltages must be within +/-{self.connection.MAX_ABS_VOLTAGE:g} V",
-            )
+        if not self._confirm_voltages(
+            voltages_to_check, "PD voltages must be", "PD includes voltage", f"Continue {action.lower()}?"
+        ):
             return None
-        if max(abs(v) for v in voltages_to_check) > self.SAFE_VOLTAGE_LIMIT:
-            proceed = messagebox.askyesno(
-                "High Voltage Warning",
-                f"PD includes voltage above {self.SAFE_VOLTAGE_LIMIT:g} V.\nContinue {action.lower()}?",
-            )
-            if not proceed:
-                return None
 
         total_reads = cycles * (pot_pulses + dep_pulses)
         if not self._confirm_large_wrer_sequence(total_reads * 2, action=action):
@@ -1768,16 +2004,20 @@ class KeithleyUI:
         gap_delay_s: float,
         cycles: int,
     ):
+        # Loop-invariant: quantize the pulse levels and coerce durations once, not per appended step.
+        pot_v, read_v, dep_v = round(pot_v, 12), round(read_v, 12), round(dep_v, 12)
+        pot_t, read_t, settle_t, dep_t = float(pot_t), float(read_t), float(settle_t), float(dep_t)
+        gap_delay_s = float(gap_delay_s)
         steps = []
         read_index = 0
         elapsed_s = 0.0
         for cycle_idx in range(1, cycles + 1):
             for _ in range(pot_pulses):
-                elapsed_s += float(pot_t)
+                elapsed_s += pot_t
                 steps.append(
                     {
-                        "voltage": round(pot_v, 12),
-                        "hold_s": float(pot_t),
+                        "voltage": pot_v,
+                        "hold_s": pot_t,
                         "measure": False,
                         "post_delay_s": 0.0,
                         "phase": "pot",
@@ -1786,11 +2026,11 @@ class KeithleyUI:
                     }
                 )
                 if settle_t > 0:
-                    elapsed_s += float(settle_t)
+                    elapsed_s += settle_t
                     steps.append(
                         {
                             "voltage": 0.0,
-                            "hold_s": float(settle_t),
+                            "hold_s": settle_t,
                             "measure": False,
                             "post_delay_s": 0.0,
                             "phase": "settle",
@@ -1799,26 +2039,26 @@ class KeithleyUI:
                         }
                     )
                 read_index += 1
-                elapsed_s += float(read_t)
+                elapsed_s += read_t
                 steps.append(
                     {
-                        "voltage": round(read_v, 12),
-                        "hold_s": float(read_t),
+                        "voltage": read_v,
+                        "hold_s": read_t,
                         "measure": True,
-                        "post_delay_s": float(gap_delay_s),
+                        "post_delay_s": gap_delay_s,
                         "cycle_id": cycle_idx,
                         "point_t": float(read_index),
                         "phase": "pot",
                         "elapsed_s": elapsed_s,
                     }
                 )
-                elapsed_s += float(gap_delay_s)
+                elapsed_s += gap_delay_s
             for _ in range(dep_pulses):
-                elapsed_s += float(dep_t)
+                elapsed_s += dep_t
                 steps.append(
                     {
-                        "voltage": round(dep_v, 12),
-                        "hold_s": float(dep_t),
+                        "voltage": dep_v,
+                        "hold_s": dep_t,
                         "measure": False,
                         "post_delay_s": 0.0,
                         "phase": "dep",
@@ -1827,11 +2067,11 @@ class KeithleyUI:
                     }
                 )
                 if settle_t > 0:
-                    elapsed_s += float(settle_t)
+                    elapsed_s += settle_t
                     steps.append(
                         {
                             "voltage": 0.0,
-                            "hold_s": float(settle_t),
+                            "hold_s": settle_t,
                             "measure": False,
                             "post_delay_s": 0.0,
                             "phase": "settle",
@@ -1840,20 +2080,20 @@ class KeithleyUI:
                         }
                     )
                 read_index += 1
-                elapsed_s += float(read_t)
+                elapsed_s += read_t
                 steps.append(
                     {
-                        "voltage": round(read_v, 12),
-                        "hold_s": float(read_t),
+                        "voltage": read_v,
+                        "hold_s": read_t,
                         "measure": True,
-                        "post_delay_s": float(gap_delay_s),
+                        "post_delay_s": gap_delay_s,
                         "cycle_id": cycle_idx,
                         "point_t": float(read_index),
                         "phase": "dep",
                         "elapsed_s": elapsed_s,
                     }
                 )
-                elapsed_s += float(gap_delay_s)
+                elapsed_s += gap_delay_s
         return steps
 
     @staticmethod
@@ -1920,6 +2160,7 @@ class KeithleyUI:
         step = self._pd_steps[self._sweep_index]
         try:
             current = self.connection.measure_current()
+            had_rows = bool(self.logger.rows)
             self.logger.add(step["voltage"], current, auto_save=self.autosave_enabled)
             self.row_cycle_ids.append(step.get("cycle_id", 0))
             self.row_time_s.append(step.get("elapsed_s"))
@@ -1927,8 +2168,10 @@ class KeithleyUI:
             self.status_text.set(
                 f"PD: read {int(step['point_t'])}/{self._count_pd_reads()} | I={current:.6e} A @ V={step['voltage']:.6g} V"
             )
-            self._refresh_embedded_plot()
-            self._update_button_states()
+            self._refresh_plot_decimated()
+            if not had_rows:
+                # Run start/finish update the buttons; between them only the first logged row changes a state.
+                self._update_button_states()
             self._advance_pd_step(post_delay_s=step.get("post_delay_s", 0.0))
         except Exception as e:
             self._finish_sweep()
@@ -1944,9 +2187,7 @@ class KeithleyUI:
                 messagebox.showerror("Error", str(e))
                 return
         self._sweep_index += 1
-        self.sweep_progress.config(value=self._sweep_index)
-        self.progress_text.set(f"Sweep progress: {self._sweep_index}/{len(self._pd_steps)}")
-        self._update_eta()
+        self._update_progress(self._sweep_index, len(self._pd_steps))
         if self.stop_flag or self._sweep_index >= len(self._pd_steps):
             if not self.stop_flag and self._sweep_index >= len(self._pd_steps):
                 self.status_text.set("Measurement finished. Output zeroed.")
@@ -1962,63 +2203,126 @@ class KeithleyUI:
         self.stop_flag = False
         self.sweep_running = True
         self._sweep_values = list(voltages)
-        self._sweep_cycle_ids = list(cycle_ids) if cycle_ids else [0] * len(self._sweep_values)
-        self._sweep_point_times = list(point_times) if point_times else [None] * len(self._sweep_values)
+        self._sweep_cycle_ids = self._padded_list(cycle_ids, len(self._sweep_values), 0)
+        self._sweep_point_times = self._padded_list(point_times, len(self._sweep_values), None)
         self._sweep_index = 0
-        self._sweep_start_time = datetime.now()
+        self._sweep_start_time = time.perf_counter()
         self.sweep_progress.config(maximum=len(self._sweep_values), value=0)
         self.progress_text.set(f"Sweep progress: 0/{len(self._sweep_values)}")
         self.eta_text.set("Elapsed: 00:00 | ETA: --:--")
         self._update_button_states()
         try:
             self.connection.zero_output()
-            self._run_next_sweep_step()
         except Exception as e:
             self._finish_sweep()
             messagebox.showerror("Error", str(e))
-
-    def _run_next_sweep_step(self):
-        if self.stop_flag or self._sweep_index >= len(self._sweep_values):
-            self._finish_sweep()
             return
+        # Set/measure runs on a worker thread with its own timing; the Tk loop only drains and logs points.
+        self._sweep_stop_event = threading.Event()
+        self._sweep_result_q = queue.Queue()
+        self._sweep_thread = threading.Thread(
+            target=self._host_sweep_worker,
+            args=(list(self._sweep_values), self.sweep_delay_ms / 1000.0, self._sweep_stop_event, self._sweep_result_q),
+            daemon=True,
+        )
+        self._sweep_thread.start()
+        self.sweep_after_id = self.root.after(self.LIVE_DRAIN_MS, self._drain_sweep_results)
 
-        voltage = self._sweep_values[self._sweep_index]
+    @staticmethod
+    def _padded_list(values, length, fill):
+        # Per-point metadata sized to the sweep up front so the logging loops can index directly.
+        padded = list(values) if values else []
+        if len(padded) < length:
+            padded.extend([fill] * (length - len(padded)))
+        return padded
+
+    def _host_sweep_worker(self, voltages, delay_s, stop_event, result_q):
         try:
-            self.connection.set_voltage(voltage)
-            current = self.connection.measure_current()
-            self.last_voltage = voltage
-            self._sync_metadata()
-            self.logger.add(voltage, current, auto_save=self.autosave_enabled)
-            cycle_id = self._sweep_cycle_ids[self._sweep_index] if self._sweep_index < len(self._sweep_cycle_ids) else 0
-            self.row_cycle_ids.append(cycle_id)
-            point_t = self._sweep_point_times[self._sweep_index] if self._sweep_index < len(self._sweep_point_times) else None
-            self.row_time_s.append(point_t)
-            self._annotate_last_row(cycle_id=cycle_id, point_t=point_t)
-            self.status_text.set(f"Sweep: point {self._sweep_index + 1}/{len(self._sweep_values)} | I={current:.6e} A")
-            self._sweep_index += 1
-            self.sweep_progress.config(value=self._sweep_index)
-            self.progress_text.set(f"Sweep progress: {self._sweep_index}/{len(self._sweep_values)}")
-            self._update_eta()
-            self._refresh_embedded_plot()
-            self.sweep_after_id = self.root.after(self.sweep_delay_ms, self._run_next_sweep_step)
+            for voltage in voltages:
+                if stop_event.is_set():
+                    break
+                # One error-queue drain per point, not per sweep: a rejected level or compliance fault must stop
+                # the sweep at that point instead of being reported after every remaining point has been logged.
+                with self.connection.batched_error_checks():
+                    self.connection.set_voltage(voltage)
+                    current = self.connection.measure_current()
+                result_q.put((voltage, current, None))
+                if stop_event.wait(delay_s):
+                    break
         except Exception as e:
+            result_q.put((None, None, e))
+        finally:
+            result_q.put(None)
+
+    def _stop_sweep_worker(self, join_timeout_s=0.0):
+        stop_event = getattr(self, "_sweep_stop_event", None)
+        if stop_event is not None:
+            stop_event.set()
+        thread = getattr(self, "_sweep_thread", None)
+        if join_timeout_s and thread is not None and thread.is_alive():
+            thread.join(timeout=join_timeout_s)
+
+    def _drain_sweep_results(self):
+        self.sweep_after_id = None
+        done = False
+        error = None
+        logged = 0
+        last_current = None
+        try:
+            # Only take what is queued now so a fast worker cannot keep the Tk loop busy indefinitely.
+            for _ in range(self._sweep_result_q.qsize()):
+                item = self._sweep_result_q.get_nowait()
+                if item is None:
+                    done = True
+                    break
+                voltage, current, error = item
+                if error is not None:
+                    continue
+                self.last_voltage = voltage
+                self.logger.add(voltage, current, auto_save=self.autosave_enabled)
+                cycle_id = self._sweep_cycle_ids[self._sweep_index]
+                self.row_cycle_ids.append(cycle_id)
+                point_t = self._sweep_point_times[self._sweep_index]
+                self.row_time_s.append(point_t)
+                self._annotate_last_row(cycle_id=cycle_id, point_t=point_t)
+                self._sweep_index += 1
+                logged += 1
+                last_current = current
+            if logged:
+                self._set_status_throttled(
+                    "Sweep: point {}/{} | I={:.6e} A", self._sweep_index, len(self._sweep_values), last_current
+                )
+                self._update_progress(self._sweep_index, len(self._sweep_values))
+                self._refresh_plot_decimated(logged)
+        except Exception as e:
+            # e.g. a failed auto-save write surfacing through logger.add: end the run and zero the source.
+            self._stop_sweep_worker()
             self._finish_sweep()
             messagebox.showerror("Error", str(e))
+            return
+        if not done:
+            self.sweep_after_id = self.root.after(self.LIVE_DRAIN_MS, self._drain_sweep_results)
+            return
+        stopped = self.stop_flag
+        self._finish_sweep()
+        if error is not None:
+            messagebox.showerror("Error", str(error))
+        elif stopped:
+            self.status_text.set("Stopped. Output zeroed.")
 
     def _run_fast_instrument_sweep(self, voltages, delay_s, cycle_ids=None, point_times=None):
         self.stop_flag = False
         self.sweep_running = True
         self._sweep_values = list(voltages)
-        self._sweep_cycle_ids = list(cycle_ids) if cycle_ids else [0] * len(self._sweep_values)
-        self._sweep_point_times = list(point_times) if point_times else [None] * len(self._sweep_values)
+        self._sweep_cycle_ids = self._padded_list(cycle_ids, len(self._sweep_values), 0)
+        self._sweep_point_times = self._padded_list(point_times, len(self._sweep_values), None)
         self._sweep_index = 0
-        self._sweep_start_time = datetime.now()
+        self._sweep_start_time = time.perf_counter()
         self.sweep_progress.config(maximum=len(self._sweep_values), value=0)
         self.progress_text.set(f"Sweep progress: 0/{len(self._sweep_values)}")
         self.eta_text.set("Elapsed: 00:00 | ETA: --:--")
         self.status_text.set("Fast TSP sweep running on instrument...")
         self._update_button_states()
-        self.root.update_idletasks()
         self._fast_sweep_result = None
         self._fast_sweep_error = None
         self._fast_sweep_kind = "iv"
@@ -2037,13 +2341,12 @@ class KeithleyUI:
         self._sweep_cycle_ids = []
         self._sweep_point_times = []
         self._sweep_index = 0
-        self._sweep_start_time = datetime.now()
+        self._sweep_start_time = time.perf_counter()
         self.sweep_progress.config(maximum=len(self._sweep_values), value=0)
         self.progress_text.set(f"Sweep progress: 0/{len(self._sweep_values)}")
         self.eta_text.set("Elapsed: 00:00 | ETA: --:--")
         self.status_text.set("Fast TSP PD running on instrument...")
         self._update_button_states()
-        self.root.update_idletasks()
         self._fast_sweep_result = None
         self._fast_sweep_error = None
         self._fast_sweep_kind = "pd"
@@ -2092,49 +2395,56 @@ class KeithleyUI:
                 return
             total = len(result)
             if kind == "pd":
-                for idx, row in enumerate(result, start=1):
-                    v = row.get("voltage", 0.0)
-                    i = row.get("current", math.nan)
-                    cycle_id = row.get("cycle_id", 0)
-                    point_t = row.get("elapsed_s")
-                    self.last_voltage = v
-                    self._sync_metadata()
-                    self.logger.add(v, i, auto_save=self.autosave_enabled)
-                    self.row_cycle_ids.append(cycle_id)
-                    self.row_time_s.append(point_t)
-                    self._annotate_last_row(cycle_id=cycle_id, point_t=point_t)
-                    self._sweep_index = idx
-                    self.sweep_progress.config(value=idx)
-                    self.progress_text.set(f"Sweep progress: {idx}/{total}")
+                voltages = [row.get("voltage", 0.0) for row in result]
+                currents = [row.get("current", math.nan) for row in result]
+                cycle_ids = [row.get("cycle_id", 0) for row in result]
+                point_times = [row.get("elapsed_s") for row in result]
+            else:
+                voltages = [v for v, _i in result]
+                currents = [i for _v, i in result]
+                cycle_ids = self._sweep_cycle_ids[:total]
+                point_times = self._sweep_point_times[:total]
+            # The instrument returned the whole run at once; log it as one batch instead of row by row.
+            plot_mode = self.active_plot_mode if self.active_plot_mode in ("iv", "wrer", "pd") else "iv"
+            self.logger.add_many(
+                voltages, currents, cycle_ids, point_times, plot_mode=plot_mode, auto_save=self.autosave_enabled
+            )
+            self.row_cycle_ids.extend(cycle_ids)
+            self.row_time_s.extend(point_times)
+            self._sweep_index = total
+            if voltages:
+                self.last_voltage = voltages[-1]
+            if kind == "pd":
                 self.status_text.set(f"Fast PD complete: {self._sweep_index} read points")
             else:
-                for idx, (v, i) in enumerate(result, start=1):
-                    self.last_voltage = v
-                    self._sync_metadata()
-                    self.logger.add(v, i, auto_save=self.autosave_enabled)
-                    cycle_id = self._sweep_cycle_ids[idx - 1] if idx - 1 < len(self._sweep_cycle_ids) else 0
-                    self.row_cycle_ids.append(cycle_id)
-                    point_t = self._sweep_point_times[idx - 1] if idx - 1 < len(self._sweep_point_times) else None
-                    self.row_time_s.append(point_t)
-                    self._annotate_last_row(cycle_id=cycle_id, point_t=point_t)
-                    self._sweep_index = idx
-                    self.sweep_progress.config(value=idx)
-                    self.progress_text.set(f"Sweep progress: {idx}/{total}")
                 self.status_text.set(f"Fast sweep complete: {self._sweep_index} points")
             self._refresh_embedded_plot()
-            self._update_eta()
+            self._update_progress(self._sweep_index, total, force=True)
         finally:
             self._finish_sweep()
 
     def stop(self):
         self.stop_flag = True
         self.live_running = False
-        if self.sweep_after_id:
-            self.root.after_cancel(self.sweep_after_id)
-            self.sweep_after_id = None
+        self._stop_live_worker()
         if self.live_after_id:
             self.root.after_cancel(self.live_after_id)
             self.live_after_id = None
+        self._stop_sweep_worker()
+        if getattr(self, "_sweep_thread", None) is not None:
+            # The drain loop logs whatever the worker already queued, then finishes the sweep (and zeroes
+            # output again) at its end marker, even if the thread itself has exited. Zero now regardless,
+            # so STOP removes the bias even if that drain never completes.
+            try:
+                self.connection.zero_output()
+            except Exception:
+                pass
+            self.status_text.set("Stop requested. Waiting for current point...")
+            self._update_button_states()
+            return
+        if self.sweep_after_id:
+            self.root.after_cancel(self.sweep_after_id)
+            self.sweep_after_id = None
         fast_thread_alive = self._fast_sweep_thread and self._fast_sweep_thread.is_alive()
         if fast_thread_alive:
             if not self._fast_sweep_poll_after_id:
@@ -2153,15 +2463,53 @@ class KeithleyUI:
         self.status_text.set("Stopped. Output zeroed.")
         self._update_button_states()
 
+    def _set_status_throttled(self, fmt, *args):
+        # Per-drain status lines change faster than anyone can read them; share the progress rate cap
+        # and only format the numbers for lines that are actually shown.
+        now = time.perf_counter()
+        if now - getattr(self, "_last_status_t", 0.0) < self.PROGRESS_MIN_INTERVAL_S:
+            self._status_pending = (fmt, args)
+            return
+        self._status_pending = None
+        self._last_status_t = now
+        self.status_text.set(fmt.format(*args))
+
+    def _update_progress(self, done, total, force=False):
+        # Progress bar, counter and ETA are three Tcl updates; cap them at PROGRESS_MIN_INTERVAL_S.
+        now = time.perf_counter()
+        if not force and done < total and now - self._last_progress_t < self.PROGRESS_MIN_INTERVAL_S:
+            self._progress_pending = (done, total)
+            return
+        self._progress_pending = None
+        self._last_progress_t = now
+        self.sweep_progress.config(value=done)
+        self.progress_text.set(f"Sweep progress: {done}/{total}")
+        self._update_eta()
+
     def _finish_sweep(self, reset_progress=True):
+        pending = getattr(self, "_progress_pending", None)
+        if pending is not None:
+            self._update_progress(*pending, force=True)
+        status_pending = getattr(self, "_status_pending", None)
+        if status_pending is not None:
+            self._status_pending = None
+            self.status_text.set(status_pending[0].format(*status_pending[1]))
         self.sweep_running = False
         self.sweep_after_id = None
+        self._sweep_thread = None
         self._fast_sweep_poll_after_id = None
         try:
             if self.connected:
                 self.connection.zero_output()
         except Exception:
             pass
+        if self._frames_since_draw:
+            self._frames_since_draw = 0
+            self._refresh_embedded_plot()
+        try:
+            self.logger.flush()
+        except Exception as e:
+            messagebox.showerror("Error", f"Auto-save failed: {e}")
         if reset_progress and self._sweep_values:
             self.progress_text.set(f"Sweep progress: {self._sweep_index}/{len(self._sweep_values)}")
         self._update_button_states()
@@ -2172,7 +2520,7 @@ class KeithleyUI:
             return
         file_path = filedialog.asksaveasfilename(
             defaultextension=".csv",
-            initialdir=self.preferred_save_dir,
+            initialdir=self._resolve_save_dir(),
             initialfile=self._default_data_filename(prefix="iv_manual"),
             filetypes=[("CSV Files", "*.csv"), ("All Files", "*.*")],
             title="Save I-V Data",
@@ -2190,9 +2538,30 @@ class KeithleyUI:
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
+    def _prefetch_save_dir(self):
+        # Warm the OS directory cache off the UI thread so the first file dialog on a network share opens quickly.
+        def _worker(path):
+            try:
+                os.listdir(path)
+            except OSError:
+                pass
+
+        threading.Thread(target=_worker, args=(self.preferred_save_dir,), daemon=True).start()
+
+    def _resolve_save_dir(self):
+        if not getattr(self, "_save_dir_checked", False):
+            self._save_dir_checked = True
+            if not os.path.isdir(self.preferred_save_dir):
+                missing = self.preferred_save_dir
+                self.preferred_save_dir = os.getcwd()
+                self.save_dir_text.set(f"Save folder: {self.preferred_save_dir}")
+                logger.warning("Save folder %s is unavailable; using %s", missing, self.preferred_save_dir)
+                self.status_text.set(f"Save folder not found: {missing}. Using {self.preferred_save_dir}")
+        return self.preferred_save_dir
+
     def choose_save_folder(self):
         folder = filedialog.askdirectory(
-            initialdir=self.preferred_save_dir,
+            initialdir=self._resolve_save_dir(),
             title="Choose Default Save Folder",
         )
         if not folder:
@@ -2207,31 +2576,58 @@ class KeithleyUI:
             if self.logger.output_file:
                 os.startfile(str(self.logger.output_file.parent))
             else:
-                os.startfile(self.preferred_save_dir)
+                os.startfile(self._resolve_save_dir())
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
     def load_csv_data(self):
+        if self._io_busy():
+            return
         file_path = filedialog.askopenfilename(
-            initialdir=self.preferred_save_dir,
+            initialdir=self._resolve_save_dir(),
             filetypes=[("Measurement Files", "*.csv *.txt"), ("CSV Files", "*.csv"), ("Text Files", "*.txt"), ("All Files", "*.*")],
             title="Load Existing Measurement File",
         )
         if not file_path:
             return
+        # Large files take a while to parse; read them into a fresh logger off the Tk thread and swap it in when done.
+        self.status_text.set(f"Loading {os.path.basename(file_path)}...")
+        self._run_io_task(
+            lambda: self._read_measurement_file(file_path),
+            lambda loaded, error: self._on_measurement_file_loaded(file_path, loaded, error),
+        )
+
+    @staticmethod
+    def _read_measurement_file(file_path):
+        loaded = DataLogger()
+        loaded.load_csv(file_path)
+        return loaded
+
+    def _on_measurement_file_loaded(self, file_path, loaded, error):
+        if error is not None:
+            self.status_text.set("Load failed")
+            messagebox.showerror("Error", str(error))
+            return
         try:
-            self.logger.load_csv(file_path)
+            previous = self.logger
+            previous.close()
+            loaded.set_metadata(previous.sample_name, previous.operator, previous.notes)
+            loaded.set_run_description(previous.run_description)
+            # Continue the revision count so plot caches keyed on it cannot match the replaced data.
+            loaded.revision += previous.revision
+            self.logger = loaded
             self.save_path_text.set(f"Save path: {file_path}")
             self.preferred_save_dir = os.path.dirname(file_path) or self.preferred_save_dir
             self.save_dir_text.set(f"Save folder: {self.preferred_save_dir}")
             self.autosave_enabled = False
             self.autosave_text.set("Auto-save: OFF (loaded data)")
-            self.row_cycle_ids = [getattr(row, "cycle_id", 0) for row in self.logger.rows]
-            self.row_time_s = [getattr(row, "elapsed_s", None) for row in self.logger.rows]
-            row_modes = [getattr(row, "plot_mode", "iv") for row in self.logger.rows]
-            if any(mode == "pd" for mode in row_modes):
+            rows = self.logger.rows
+            self.row_cycle_ids = list(map(attrgetter("cycle_id"), rows))
+            self.row_time_s = list(map(attrgetter("elapsed_s"), rows))
+            row_modes = set(map(attrgetter("plot_mode"), rows))
+            if "pd" in row_modes:
                 loaded_mode = "pd"
-            elif any(mode == "wrer" for mode in row_modes) or any(t is not None for t in self.row_time_s):
+            elif "wrer" in row_modes or self.row_time_s.count(None) != len(self.row_time_s):
                 loaded_mode = "wrer"
             else:
                 loaded_mode = "iv"
@@ -2239,6 +2635,7 @@ class KeithleyUI:
             self._last_run_mode = loaded_mode
             self._refresh_embedded_plot()
             self._update_button_states()
+            self.status_text.set(f"Loaded {len(rows)} rows")
             messagebox.showinfo("Loaded", f"Loaded data from:\n{file_path}")
         except Exception as e:
             messagebox.showerror("Error", str(e))
@@ -2248,6 +2645,7 @@ class KeithleyUI:
         self.logger.set_run_description("")
         self.row_cycle_ids = []
         self.row_time_s = []
+        self._rb_reset()
         self.active_plot_mode = "iv"
         self._last_run_mode = "iv"
         self._refresh_embedded_plot()
@@ -2303,14 +2701,11 @@ class KeithleyUI:
             return
         xscale, yscale = self._get_axis_scales()
         cycle_series = self._build_cycle_series(xscale, yscale)
-        has_points = any(series["x"] for series in cycle_series.values())
-        if not has_points:
+        if not cycle_series:
             messagebox.showinfo("Plot", "No plottable points for selected log axis (needs positive values)")
             return
         plot_series = []
         for idx, (cycle_id, series) in enumerate(cycle_series.items(), start=1):
-            if not series["x"]:
-                continue
             label = f"Cycle {cycle_id}" if cycle_id > 0 else None
             plot_series.append(
                 {
@@ -2328,6 +2723,15 @@ class KeithleyUI:
         )
 
     def _refresh_embedded_plot(self):
+        pending = getattr(self, "_plot_refresh_after_id", None)
+        if pending is not None:
+            # A full refresh now satisfies any queued one.
+            self._plot_refresh_after_id = None
+            self.root.after_cancel(pending)
+        self._live_line = None
+        self._blit_bg = None
+        self._cycle_lines = {}
+        self._wrer_lines = None
         self._sync_active_plot_mode_from_data()
         if self.active_plot_mode == "pd":
             iv, vy, ii, iy = self._build_pd_plot_series()
@@ -2345,7 +2749,7 @@ class KeithleyUI:
                 ax_i.plot(tx_i, iy_i, linestyle="None", marker="o")
             else:
                 ax_i.set_yscale("linear")
-                ax_i.plot(ii, [abs(y) for y in iy], linestyle="None", marker="o")
+                ax_i.plot(ii, np.abs(iy), linestyle="None", marker="o")
             ax_v.set_ylabel("Voltage (V)")
             ax_i.set_ylabel("|Current| (A)")
             ax_i.set_xlabel("Index")
@@ -2366,14 +2770,15 @@ class KeithleyUI:
             ax_i = self.figure.add_subplot(212, sharex=ax_v)
             ax_v.grid(True)
             ax_i.grid(True)
-            ax_v.plot(tx, vy, linestyle="-", marker="o")
+            (line_v,) = ax_v.plot(tx, vy, linestyle="-", marker="o")
             if yscale == "log":
                 tx_i, iy_i = IVPlotter.prepare_log_y_data(tx, iy)
                 ax_i.set_yscale("log")
-                ax_i.plot(tx_i, iy_i, linestyle="-", marker="o")
+                (line_i,) = ax_i.plot(tx_i, iy_i, linestyle="-", marker="o")
             else:
                 ax_i.set_yscale("linear")
-                ax_i.plot(tx, iy, linestyle="-", marker="o")
+                (line_i,) = ax_i.plot(tx, iy, linestyle="-", marker="o")
+            self._wrer_lines = (ax_v, ax_i, line_v, line_i)
             ax_v.set_ylabel("Voltage (V)")
             ax_i.set_ylabel("Current (A)")
             ax_i.set_xlabel("Time (s)")
@@ -2385,7 +2790,7 @@ class KeithleyUI:
             self.canvas.draw_idle()
             return
         xscale, yscale = self._get_axis_scales()
-        cycle_series = self._build_cycle_series(xscale, yscale)
+        cycle_series = self._build_cycle_series(xscale, yscale, skip_tail=self._live_tail_count())
 
         # If we switched from WRER, the single axis `self.ax` was destroyed. Recreate it.
         if not self.ax or not self.figure.axes or len(self.figure.axes) != 1:
@@ -2398,29 +2803,152 @@ class KeithleyUI:
         self.ax.set_xscale(xscale)
         self.ax.set_yscale(yscale)
         if xscale == "linear":
-            self.ax.xaxis.set_major_formatter(FormatStrFormatter("%.6g"))
+            self.ax.xaxis.set_major_formatter(self._X_LINEAR_FORMATTER)
         if yscale == "linear":
-            self.ax.yaxis.set_major_formatter(FormatStrFormatter("%.4e"))
+            self.ax.yaxis.set_major_formatter(self._Y_LINEAR_FORMATTER)
         self.ax.set_xlabel("Voltage (V)")
         self.ax.set_ylabel("Current (A)")
         self.ax.set_title(self._current_plot_title())
-        cmap = cm.get_cmap("tab20")
+        colors = self._CYCLE_COLORS
+        has_labels = False
+        live_color_idx = len(cycle_series)
         for idx, (cycle_id, series) in enumerate(cycle_series.items()):
-            if not series["x"]:
-                continue
             label = f"Cycle {cycle_id}" if cycle_id > 0 else None
-            self.ax.plot(
+            if cycle_id == 0:
+                live_color_idx = idx
+            has_labels = has_labels or label is not None
+            (self._cycle_lines[cycle_id],) = self.ax.plot(
                 series["x"],
                 series["y"],
                 marker="o",
                 linestyle="-",
-                color=cmap(idx % 20),
+                color=colors[idx % 20],
                 label=label,
             )
-        if any(cycle_id > 0 and series["x"] for cycle_id, series in cycle_series.items()):
+        if self._live_tail_count():
+            live_x, live_y = self._live_plot_data(xscale, yscale)
+            (self._live_line,) = self.ax.plot(
+                live_x,
+                live_y,
+                marker="o",
+                linestyle="-",
+                color=colors[live_color_idx % 20],
+                animated=True,
+            )
+        if has_labels:
             self.ax.legend(loc="best")
         self.canvas.draw_idle()
 
+    def _on_axis_scale_changed(self):
+        if not self.logger.rows and self.active_plot_mode == "iv" and self.ax is not None:
+            # Nothing plotted yet: switch the scales on the existing axes instead of rebuilding them.
+            self._apply_iv_axis_scales(*self._get_axis_scales())
+            self.canvas.draw_idle()
+            return
+        if not (self._update_iv_lines_in_place() or self._update_wrer_lines_in_place()):
+            self._refresh_embedded_plot()
+
+    def _update_iv_lines_in_place(self):
+        # Reuse the existing cycle lines when the plotted cycles are unchanged (scale toggles, sweep
+        # points landing in the current cycle) or a sweep has only started new cycles after them;
+        # anything else makes the caller do a full refresh.
+        lines = getattr(self, "_cycle_lines", None) or {}
+        live_line = getattr(self, "_live_line", None)
+        if self.active_plot_mode != "iv" or self.ax is None or (not lines and live_line is None):
+            return False
+        xscale, yscale = self._get_axis_scales()
+        cycle_series = self._build_cycle_series(xscale, yscale, skip_tail=self._live_tail_count())
+        cycle_order = list(cycle_series)
+        if cycle_order[: len(lines)] != list(lines):
+            return False
+        if live_line is not None and len(cycle_order) != len(lines):
+            return False
+        new_cycles = cycle_order[len(lines) :]
+        for idx, cycle_id in enumerate(new_cycles, start=len(lines)):
+            (lines[cycle_id],) = self.ax.plot(
+                [],
+                [],
+                marker="o",
+                linestyle="-",
+                color=self._CYCLE_COLORS[idx % 20],
+                label=f"Cycle {cycle_id}" if cycle_id > 0 else None,
+            )
+        if any(cycle_id > 0 for cycle_id in new_cycles):
+            self.ax.legend(loc="best")
+        self._apply_iv_axis_scales(xscale, yscale)
+        self._sync_plot_title(self.ax)
+        for cycle_id, series in cycle_series.items():
+            lines[cycle_id].set_data(series["x"], series["y"])
+        if live_line is not None:
+            live_line.set_data(*self._live_plot_data(xscale, yscale))
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.canvas.draw_idle()
+        return True
+
+    def _sync_plot_title(self, ax):
+        # Reused lines can outlive the run that drew them; the title names the output file, so keep it current.
+        title = self._current_plot_title()
+        if ax.get_title() != title:
+            ax.set_title(title)
+
+    def _apply_iv_axis_scales(self, xscale, yscale):
+        if self.ax.get_xscale() != xscale:
+            self.ax.set_xscale(xscale)
+            if xscale == "linear":
+                self.ax.xaxis.set_major_formatter(self._X_LINEAR_FORMATTER)
+        if self.ax.get_yscale() != yscale:
+            self.ax.set_yscale(yscale)
+            if yscale == "linear":
+                self.ax.yaxis.set_major_formatter(self._Y_LINEAR_FORMATTER)
+
+    def _update_wrer_lines_in_place(self):
+        # WRER keeps its two axes and lines between sweep repaints; only the data and y scale change.
+        wrer_lines = getattr(self, "_wrer_lines", None)
+        if self.active_plot_mode != "wrer" or wrer_lines is None:
+            return False
+        ax_v, ax_i, line_v, line_i = wrer_lines
+        self._sync_plot_title(ax_v)
+        tx, vy, iy = self._build_wrer_plot_series()
+        _, yscale = self._get_axis_scales()
+        line_v.set_data(tx, vy)
+        if yscale == "log":
+            line_i.set_data(*IVPlotter.prepare_log_y_data(tx, iy))
+        else:
+            line_i.set_data(tx, iy)
+        if ax_i.get_yscale() != yscale:
+            ax_i.set_yscale(yscale)
+        for ax in (ax_v, ax_i):
+            ax.relim()
+            ax.autoscale_view(scalex=False)
+        x_right = max(tx) if tx else 0.0
+        ax_v.set_xlim(left=0.0, right=x_right if x_right > 0 else 1.0)
+        self.canvas.draw_idle()
+        return True
+
+    def _plot_refresh_every_n(self):
+        try:
+            return max(1, int(self.plot_every_spin.get()))
+        except (AttributeError, ValueError):
+            return 1
+
+    def _refresh_plot_decimated(self, points=1):
+        # Host sweeps redraw every N points; _finish_sweep draws whatever is still pending.
+        self._frames_since_draw += points
+        if self._frames_since_draw >= self._plot_refresh_every_n():
+            self._frames_since_draw = 0
+            self._request_plot_refresh()
+
+    def _request_plot_refresh(self):
+        # Coalesce redraw requests into at most one full refresh per PLOT_REPAINT_MS.
+        if self._plot_refresh_after_id is None:
+            self._plot_refresh_after_id = self.root.after(self.PLOT_REPAINT_MS, self._run_requested_plot_refresh)
+
+    def _run_requested_plot_refresh(self):
+        self._plot_refresh_after_id = None
+        if not (self._update_iv_lines_in_place() or self._update_wrer_lines_in_place()):
+            self._refresh_embedded_plot()
+
     def _get_axis_scales(self):
         xscale = "log" if self.x_axis_scale_combo.get().lower() == "log" else "linear"
         yscale = "log" if self.y_axis_scale_combo.get().lower() == "log" else "linear"
@@ -2472,61 +3000,87 @@ class KeithleyUI:
             self.active_plot_mode = inferred
 
     def _build_pd_plot_series(self):
-        iv = []
-        vy = []
-        ii = []
-        iy = []
-        for idx, row in enumerate(self.logger.rows):
-            x_value = float(idx + 1)
-            iv.append(x_value)
-            vy.append(row.voltage)
-            if isinstance(row.current, (int, float)) and math.isfinite(row.current):
-                ii.append(x_value)
-                iy.append(row.current)
-        return iv, vy, ii, iy
-
-    def _build_cycle_series(self, xscale, yscale):
-        cycle_ids = list(self.row_cycle_ids)
-        rows_len = len(self.logger.rows)
-        if len(cycle_ids) < rows_len:
-            cycle_ids.extend([0] * (rows_len - len(cycle_ids)))
-        elif len(cycle_ids) > rows_len:
-            cycle_ids = cycle_ids[:rows_len]
+        rows = self.logger.rows
+        # Pull both columns with C-level attrgetter maps instead of a per-row Python loop.
+        index = np.arange(1, len(rows) + 1, dtype=float)
+        voltages = list(map(attrgetter("voltage"), rows))
+        currents = np.fromiter(map(attrgetter("current"), rows), dtype=float, count=len(rows))
+        finite = np.isfinite(currents)
+        return index.tolist(), voltages, index[finite].tolist(), currents[finite].tolist()
+
+    def _build_cycle_series(self, xscale, yscale, skip_tail=0):
+        # Refreshes without new rows (tab switches, repeated repaints) reuse the last grouping.
+        key = (self.logger.revision, len(self.row_cycle_ids), skip_tail, xscale, yscale)
+        cached = getattr(self, "_cycle_series_cache", None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        series = self._group_cycle_series(xscale, yscale, skip_tail)
+        self._cycle_series_cache = (key, series)
+        return series
 
-        series = {}
-        for row, cycle_id in zip(self.logger.rows, cycle_ids):
-            voltage = row.voltage
-            current = row.current
-            if xscale == "log" and voltage <= 0:
-                continue
+    def _group_cycle_series(self, xscale, yscale, skip_tail):
+        n = max(0, len(self.logger.rows) - skip_tail)
+        # Read the logger's column arrays in place. These views must not outlive this call, because
+        # array('d') refuses to grow while a buffer is exported, so every series handed out below is a copy.
+        x = np.frombuffer(self.logger.voltages, dtype=float)[:n]
+        y = np.frombuffer(self.logger.currents, dtype=float)[:n]
+        cycle_ids = np.zeros(n, dtype=np.int64)
+        src = self.row_cycle_ids
+        known = min(n, len(src))
+        # Skip the list slice copy in the usual case where the lists are already in step with the rows.
+        cycle_ids[:known] = src if len(src) == known else src[:known]
+
+        if xscale == "log" or yscale == "log":
+            mask = np.ones(n, dtype=bool)
+            if xscale == "log":
+                mask &= x > 0
             if yscale == "log":
-                current = abs(current)
-                if current == 0:
-                    continue
-            if cycle_id not in series:
-                series[cycle_id] = {"x": [], "y": []}
-            series[cycle_id]["x"].append(voltage)
-            series[cycle_id]["y"].append(current)
+                y = np.abs(y)
+                mask &= y != 0
+            if not mask.all():
+                x, y, cycle_ids = x[mask], y[mask], cycle_ids[mask]
+        if not cycle_ids.size:
+            return {}
+
+        ids, first, counts = np.unique(cycle_ids, return_index=True, return_counts=True)
+        if ids.size == 1:
+            # Single cycle: no regrouping needed, just detach from the logger's buffer if still a view.
+            return {int(ids[0]): {"x": x.copy() if x.base is not None else x, "y": y.copy() if y.base is not None else y}}
+
+        # Group by cycle id, keeping point order within a cycle and cycles in order of first appearance.
+        order = np.argsort(cycle_ids, kind="stable")
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        series = {}
+        for k in np.argsort(first):
+            idx = order[starts[k] : starts[k] + counts[k]]
+            series[int(ids[k])] = {"x": x[idx], "y": y[idx]}
         return series
 
     def _build_wrer_plot_series(self):
-        times = list(self.row_time_s)
-        rows_len = len(self.logger.rows)
-        if len(times) < rows_len:
-            times.extend([None] * (rows_len - len(times)))
-        elif len(times) > rows_len:
-            times = times[:rows_len]
-        tx = []
-        vy = []
-        iy = []
-        for idx, row in enumerate(self.logger.rows):
-            t = times[idx]
-            if t is None:
-                t = float(idx)
-            tx.append(float(t))
-            vy.append(row.voltage)
-            iy.append(row.current)
-        return tx, vy, iy
+        key = (self.logger.revision, len(self.row_time_s))
+        cached = getattr(self, "_wrer_series_cache", None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        series = self._collect_wrer_plot_series()
+        self._wrer_series_cache = (key, series)
+        return series
+
+    def _collect_wrer_plot_series(self):
+        n = len(self.logger.rows)
+        # Points without a recorded time fall back to their index.
+        tx = np.arange(n, dtype=float)
+        src = self.row_time_s
+        known = min(n, len(src))
+        if known:
+            times = np.array(src if len(src) == known else src[:known], dtype=float)
+            has_time = ~np.isnan(times)
+            tx[:known][has_time] = times[has_time]
+        return tx.tolist(), self.logger.voltages.tolist(), self.logger.currents.tolist()
+
+    def _on_metadata_edited(self, _event=None):
+        # Runs snapshot metadata at start; pick up edits made while one is in progress.
+        if self.live_running or self.sweep_running:
+            self._sync_metadata()
 
     def _sync_metadata(self):
         pd_sample = ""
@@ -2549,7 +3103,7 @@ class KeithleyUI:
         pot_v = self.pd_pot_v_entry.get().strip() if hasattr(self, "pd_pot_v_entry") else ""
         dep_v = self.pd_dep_v_entry.get().strip() if hasattr(self, "pd_dep_v_entry") else ""
         read_v = self.pd_read_v_entry.get().strip() if hasattr(self, "pd_read_v_entry") else ""
-        date_text = datetime.now().strftime("%Y%m%d")
+        date_text = time.strftime("%Y%m%d")
         parts = [
             f"Test{test_no or '00'}",
             "I-V data",
@@ -2568,18 +3122,23 @@ class KeithleyUI:
         return "_".join(parts)
 
     def _pd_output_filename(self):
-        name = re.sub(r'[<>:"/\\|?*\s]+', "_", self._pd_graph_title()).strip("._")
+        name = self._PD_FILENAME_UNSAFE_RE.sub("_", self._pd_graph_title()).strip("._")
         return f"{name or 'pd_run'}.txt"
 
     def _update_eta(self):
-        if not self._sweep_start_time or self._sweep_index == 0:
+        if self._sweep_start_time is None or self._sweep_index == 0:
             self.eta_text.set("Elapsed: 00:00 | ETA: --:--")
             return
-        elapsed = datetime.now() - self._sweep_start_time
-        elapsed_sec = int(elapsed.total_seconds())
-        avg_per_point = elapsed.total_seconds() / self._sweep_index
+        elapsed = time.perf_counter() - self._sweep_start_time
+        elapsed_sec = int(elapsed)
+        avg_per_point = elapsed / self._sweep_index
         remaining_points = max(0, len(self._sweep_values) - self._sweep_index)
         remaining_sec = int(avg_per_point * remaining_points)
+        # The label has one-second resolution; skip the Tcl update when neither figure changed.
+        key = (self._sweep_start_time, elapsed_sec, remaining_sec)
+        if key == getattr(self, "_last_eta_key", None):
+            return
+        self._last_eta_key = key
         self.eta_text.set(
             f"Elapsed: {elapsed_sec // 60:02d}:{elapsed_sec % 60:02d} | ETA: {remaining_sec // 60:02d}:{remaining_sec % 60:02d}"
         )
@@ -2605,10 +3164,19 @@ class KeithleyUI:
         self._closing = True
         self._save_ui_settings()
         self.stop()
+        self._stop_live_worker(join_timeout_s=2.0)
+        self._stop_sweep_worker(join_timeout_s=2.0)
+        sweep_thread = getattr(self, "_sweep_thread", None)
+        if sweep_thread is not None and not sweep_thread.is_alive():
+            # Log the last drained points and zero the output before the connection closes.
+            if self.sweep_after_id:
+                self.root.after_cancel(self.sweep_after_id)
+            self._drain_sweep_results()
         if self._fast_sweep_thread and self._fast_sweep_thread.is_alive():
             self.status_text.set("Closing after fast sweep completes...")
             self._wait_for_fast_sweep_then_close()
             return
+        self._close_logger()
         self.connection.close()
         self.root.destroy()
 
@@ -2617,24 +3185,28 @@ class KeithleyUI:
             self._close_wait_after_id = self.root.after(100, self._wait_for_fast_sweep_then_close)
             return
         self._close_wait_after_id = None
+        self._close_logger()
         self.connection.close()
         self.root.destroy()
 
+    def _close_logger(self):
+        # Write out buffered auto-save rows and wait for the background writer before the window goes away.
+        try:
+            self.logger.close()
+        except Exception as e:
+            messagebox.showerror("Error", f"Auto-save failed: {e}")
+
     @staticmethod
-    def _build_sweep_values(start: float, stop: float, step: float):
-        if (stop - start) * step < 0:
-            return []
-        values = []
-        value = start
-        if step > 0:
-            while value <= stop + (abs(step) / 1000):
-                values.append(round(value, 12))
-                value += step
-        else:
-            while value >= stop - (abs(step) / 1000):
-                values.append(round(value, 12))
-                value += step
-        return values
+    def _sweep_array(start: float, stop: float, step: float):
+        if step == 0 or (stop - start) * step < 0:
+            return np.empty(0)
+        # Exact point count (with the same 1/1000-step endpoint tolerance) instead of accumulating step.
+        count = int(math.floor((stop - start) / step + 1e-3)) + 1
+        return np.round(start + np.arange(count) * step, 12)
+
+    @classmethod
+    def _build_sweep_values(cls, start: float, stop: float, step: float):
+        return cls._sweep_array(start, stop, step).tolist()
 
     @classmethod
     def _build_simple_cycle_values_with_cycles(cls, peak_v: float, step: float, cycles: int):
@@ -2645,23 +3217,25 @@ class KeithleyUI:
         if peak == 0:
             return [0.0], [1]
 
-        seg1 = cls._build_sweep_values(0.0, peak, step_mag)
-        seg2 = cls._build_sweep_values(peak, 0.0, -step_mag)
-        seg3 = cls._build_sweep_values(0.0, -peak, -step_mag)
-        seg4 = cls._build_sweep_values(-peak, 0.0, step_mag)
-        if not seg1 or not seg2 or not seg3 or not seg4:
+        seg1 = cls._sweep_array(0.0, peak, step_mag)
+        seg2 = cls._sweep_array(peak, 0.0, -step_mag)
+        seg3 = cls._sweep_array(0.0, -peak, -step_mag)
+        seg4 = cls._sweep_array(-peak, 0.0, step_mag)
+        if not (seg1.size and seg2.size and seg3.size and seg4.size):
             return [], []
 
-        single = seg1 + seg2[1:] + seg3[1:] + seg4[1:]
-        values = list(single)
-        cycle_ids = [1] * len(single)
-        for cycle_idx in range(2, cycles + 1):
-            values.extend(single[1:])
-            cycle_ids.extend([cycle_idx] * (len(single) - 1))
-        return values, cycle_ids
+        single = np.concatenate((seg1, seg2[1:], seg3[1:], seg4[1:]))
+        values = np.concatenate((single, np.tile(single[1:], cycles - 1)))
+        cycle_ids = np.concatenate(
+            (
+                np.ones(len(single), dtype=np.int64),
+                np.repeat(np.arange(2, cycles + 1, dtype=np.int64), len(single) - 1),
+            )
+        )
+        return values.tolist(), cycle_ids.tolist()
 
     def _default_data_filename(self, prefix="iv"):
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         sample = self._slug_text(self.sample_entry.get())
         operator = self._slug_text(self.operator_entry.get())
         parts = [prefix]
@@ -2674,6 +3248,6 @@ class KeithleyUI:
 
     @staticmethod
     def _slug_text(value: str):
-        cleaned = re.sub(r"[^A-Za-z0-9_-]+", "-", value.strip())
+        cleaned = KeithleyUI._SLUG_UNSAFE_RE.sub("-", value.strip())
         cleaned = cleaned.strip("-_")
         return cleaned[:40]
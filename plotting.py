@@ -1,22 +1,19 @@
-import matplotlib.pyplot as plt
-import math
+import numpy as np
 from matplotlib.ticker import FormatStrFormatter
+from matplotlib import colormaps
 
 
 class IVPlotter:
+    _CYCLE_COLORS = tuple(colormaps["tab20"](i) for i in range(20))
+
     @staticmethod
     def prepare_log_y_data(x_data, y_data):
         """Prepares data for log scale plotting on y-axis by taking abs(y) and removing zeros."""
-        new_x, new_y = [], []
-        for x, y in zip(x_data, y_data):
-            if not isinstance(y, (int, float)) or not math.isfinite(y):
-                continue
-            ay = abs(y)
-            if ay == 0:
-                continue
-            new_x.append(x)
-            new_y.append(ay)
-        return new_x, new_y
+        n = min(len(x_data), len(y_data))
+        x = np.asarray(x_data, dtype=float)[:n]
+        ay = np.abs(np.asarray(y_data, dtype=float)[:n])
+        keep = np.isfinite(ay) & (ay != 0)
+        return x[keep].tolist(), ay[keep].tolist()
 
     @staticmethod
     def show(
@@ -32,34 +29,56 @@ class IVPlotter:
         has_data = bool(cycle_series) or bool(voltages)
         if not has_data:
             return
-        plt.figure("I-V Curve")
-        plt.clf()
-        ax = plt.gca()
+        # pyplot is only needed for the popups; importing it here keeps it (and backend selection) off app startup.
+        import matplotlib.pyplot as plt
+
+        shown = plt.fignum_exists("I-V Curve")
+        fig = plt.figure("I-V Curve")
+        layout_key = ("iv", xscale, yscale, title, xlabel, ylabel)
+        reuse = shown and getattr(fig, "_popup_layout_key", None) == layout_key and len(fig.axes) == 1
+        if reuse:
+            # Same scales and labels as the laid-out axes: clear them in place so their solved position is kept.
+            ax = fig.axes[0]
+            ax.cla()
+        else:
+            fig.clf()
+            ax = fig.add_subplot()
         if cycle_series:
-            cmap = plt.get_cmap("tab20")
+            colors = IVPlotter._CYCLE_COLORS
             for entry in cycle_series:
                 xs = entry.get("x", [])
                 ys = entry.get("y", [])
-                if not xs:
+                if len(xs) == 0:
                     continue
                 color_index = entry.get("color_index", 0)
                 label = entry.get("label")
-                ax.plot(xs, ys, marker="o", linestyle="-", color=cmap(color_index % 20), label=label)
+                ax.plot(xs, ys, marker="o", linestyle="-", color=colors[color_index % 20], label=label)
             if any(entry.get("label") for entry in cycle_series):
                 ax.legend(loc="best")
         else:
             ax.plot(voltages, currents, marker="o")
-        plt.xscale(xscale)
-        plt.yscale(yscale)
+        ax.set_xscale(xscale)
+        ax.set_yscale(yscale)
         if xscale == "linear":
-            plt.gca().xaxis.set_major_formatter(FormatStrFormatter("%.6g"))
+            ax.xaxis.set_major_formatter(FormatStrFormatter("%.6g"))
         if yscale == "linear":
-            plt.gca().yaxis.set_major_formatter(FormatStrFormatter("%.4e"))
-        plt.xlabel(xlabel)
-        plt.ylabel(ylabel)
-        plt.title(title)
-        plt.grid(True)
-        plt.tight_layout()
+            ax.yaxis.set_major_formatter(FormatStrFormatter("%.4e"))
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+        ax.set_title(title)
+        ax.grid(True)
+        IVPlotter._present_popup(plt, fig, shown, layout_key, relayout=not reuse)
+
+    @staticmethod
+    def _present_popup(plt, fig, shown, layout_key, relayout):
+        # tight_layout runs when the axes were rebuilt and on window resize, not on every draw (pan/zoom).
+        if relayout:
+            fig.tight_layout()
+            fig._popup_layout_key = layout_key
+        if shown:
+            fig.canvas.draw_idle()
+            return
+        fig.canvas.mpl_connect("resize_event", lambda _event: fig.tight_layout())
         plt.show(block=False)
 
     @staticmethod
@@ -79,10 +98,20 @@ class IVPlotter:
     ):
         if not times:
             return
-        plt.figure("Time Series")
-        plt.clf()
-        ax_v = plt.subplot(211)
-        ax_i = plt.subplot(212, sharex=ax_v)
+        import matplotlib.pyplot as plt
+
+        shown = plt.fignum_exists("Time Series")
+        fig = plt.figure("Time Series")
+        layout_key = ("time", current_yscale, title, xlabel, current_ylabel)
+        reuse = shown and getattr(fig, "_popup_layout_key", None) == layout_key and len(fig.axes) == 2
+        if reuse:
+            ax_v, ax_i = fig.axes
+            ax_v.cla()
+            ax_i.cla()
+        else:
+            fig.clf()
+            ax_v = fig.add_subplot(211)
+            ax_i = fig.add_subplot(212, sharex=ax_v)
         ax_v.plot(times, voltages, marker="o", linestyle=voltage_linestyle)
         current_x = current_times if current_times is not None else times
         if current_yscale == "log":
@@ -91,7 +120,9 @@ class IVPlotter:
             ax_i.plot(t_i, i_i, marker="o", linestyle=current_linestyle)
         else:
             ax_i.set_yscale("linear")
-            plot_y = [abs(y) if current_use_abs and isinstance(y, (int, float)) and math.isfinite(y) else y for y in currents]
+            plot_y = np.asarray(currents, dtype=float)
+            if current_use_abs:
+                plot_y = np.abs(plot_y)
             ax_i.plot(current_x, plot_y, marker="o", linestyle=current_linestyle)
         ax_v.set_ylabel("Voltage (V)")
         ax_i.set_ylabel(current_ylabel)
@@ -101,5 +132,4 @@ class IVPlotter:
         ax_i.grid(True)
         if xlim is not None and len(xlim) == 2:
             ax_v.set_xlim(xlim[0], xlim[1])
-        plt.tight_layout()
-        plt.show(block=False)
+        IVPlotter._present_popup(plt, fig, shown, layout_key, relayout=not reuse)
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 import unittest
 from types import SimpleNamespace
@@ -83,12 +84,17 @@ class _DummyRoot:
     def after_cancel(self, token):
         self.cancelled.append(token)
 
-    def after(self, delay_ms, callback):
+    def after(self, delay_ms, callback, *args):
         token = f"after-{self._next_token}"
         self._next_token += 1
-        self.after_calls.append((token, delay_ms, callback))
+        self.after_calls.append((token, delay_ms, (lambda: callback(*args)) if args else callback))
         return token
 
+    def run_pending(self):
+        while self.after_calls:
+            _token, _delay_ms, callback = self.after_calls.pop(0)
+            callback()
+
     def destroy(self):
         self.destroyed = True
 
@@ -187,19 +193,23 @@ class KeithleyUIRegressions(unittest.TestCase):
         self.assertEqual(ui.logger.rows[-1].elapsed_s, 1.25)
 
     def test_loaded_wrer_data_restores_plot_metadata_and_disables_autosave(self):
-        ui = KeithleyUI.__new__(KeithleyUI)
-        ui.logger = SimpleNamespace(
-            rows=[
-                Measurement("2026-03-11T12:00:00", 1.0, 2.0e-6, elapsed_s=0.0, cycle_id=1),
-                Measurement("2026-03-11T12:00:01", 0.1, 1.0e-6, elapsed_s=1.0, cycle_id=1),
-            ],
-            load_csv=lambda _path: None,
+        path = Path("csv_test_loaded_wrer_tmp.csv")
+        path.write_text(
+            "timestamp,voltage,current,sample_name,operator,notes,elapsed_s,cycle_id,plot_mode,run_description\n"
+            "2026-03-11T12:00:00,1.0,2e-06,,,,0.0,1,iv,\n"
+            "2026-03-11T12:00:01,0.1,1e-06,,,,1.0,1,iv,\n",
+            encoding="utf-8",
         )
+        ui = KeithleyUI.__new__(KeithleyUI)
+        ui.root = _DummyRoot()
+        ui.logger = DataLogger()
+        ui.logger.set_metadata("sample", "op", "notes")
         ui.preferred_save_dir = "C:\\data"
         ui.autosave_enabled = True
         ui.save_path_text = _DummyTextVar()
         ui.save_dir_text = _DummyTextVar()
         ui.autosave_text = _DummyTextVar()
+        ui.status_text = _DummyTextVar()
         ui._refresh_embedded_plot = lambda: None
         ui._update_button_states = lambda: None
 
@@ -209,15 +219,24 @@ class KeithleyUIRegressions(unittest.TestCase):
         original_info = gui_module.messagebox.showinfo
         original_error = gui_module.messagebox.showerror
         try:
-            gui_module.filedialog.askopenfilename = lambda **_kwargs: "C:\\data\\wrer.csv"
+            gui_module.filedialog.askopenfilename = lambda **_kwargs: str(path)
             gui_module.messagebox.showinfo = lambda *_args, **_kwargs: None
-            gui_module.messagebox.showerror = lambda *_args, **_kwargs: None
+            gui_module.messagebox.showerror = lambda *args, **_kwargs: self.fail(args)
+            original_logger = ui.logger
             ui.load_csv_data()
+            ui._io_thread.join(timeout=5)
+            self.assertIs(ui.logger, original_logger)
+            ui.root.run_pending()
         finally:
             gui_module.filedialog.askopenfilename = original_dialog
             gui_module.messagebox.showinfo = original_info
             gui_module.messagebox.showerror = original_error
+            path.unlink(missing_ok=True)
 
+        self.assertIsNot(ui.logger, original_logger)
+        self.assertGreater(ui.logger.revision, original_logger.revision)
+        self.assertEqual(ui.logger.sample_name, "sample")
+        self.assertEqual(len(ui.logger.rows), 2)
         self.assertFalse(ui.autosave_enabled)
         self.assertEqual(ui.row_cycle_ids, [1, 1])
         self.assertEqual(ui.row_time_s, [0.0, 1.0])
@@ -229,6 +248,36 @@ class KeithleyUIRegressions(unittest.TestCase):
         self.assertTrue(KeithleyConnection._looks_like_2600_tsp_model("KEITHLEY,2601A,TSP"))
         self.assertFalse(KeithleyConnection._looks_like_2600_tsp_model("KEITHLEY,2450,1234,1.0"))
 
+    def test_validate_voltages_accepts_only_real_numbers(self):
+        import numpy as np
+
+        self.assertEqual(KeithleyConnection._validate_voltages([0, 1.5, np.float64(-2.0)]), [0.0, 1.5, -2.0])
+        for bad in (["1.5"], [0.1, True], np.array(["1.0"]), [None], [float("nan")], [1e6]):
+            with self.assertRaises(RuntimeError):
+                KeithleyConnection._validate_voltages(bad)
+
+    def test_fast_tsp_sweep_runs_in_buffer_sized_chunks(self):
+        conn = KeithleyConnection()
+        conn.inst = SimpleNamespace(timeout=5000)
+        conn.mode = "tsp2600"
+        conn._tsp_sweep_loaded = True
+        conn._tsp_buffer_capacity = 2
+        conn.enable_output = lambda: None
+        conn._check_instrument_errors = lambda: None
+        chunks = []
+
+        def fake_query_binary(cmd, points):
+            chunks.append(points)
+            return [float(len(chunks))] * points
+
+        conn._query_binary = fake_query_binary
+
+        result = conn.run_tsp_sweep([0.1, 0.2, 0.3, 0.4, 0.5], 0.0)
+
+        self.assertEqual(chunks, [2, 2, 1])
+        self.assertEqual(result, [(0.1, 1.0), (0.2, 1.0), (0.3, 2.0), (0.4, 2.0), (0.5, 3.0)])
+        self.assertEqual(conn.inst.timeout, 5000)
+
     def test_build_pd_steps_creates_read_after_each_program_pulse(self):
         steps = KeithleyUI._build_pd_steps_with_cycles(
             pot_v=1.5,
@@ -271,6 +320,60 @@ class KeithleyUIRegressions(unittest.TestCase):
         self.assertEqual(ii, [3.0])
         self.assertEqual(iy, [2.5e-6])
 
+    def test_cycle_series_groups_by_cycle_and_filters_log_axes(self):
+        points = [(-0.5, 1e-6), (0.5, -2e-6), (1.0, 0.0), (0.2, 3e-6), (-0.2, -4e-6), (0.0, 5e-6), (0.3, 6e-6), (0.4, 7e-6)]
+        ui = KeithleyUI.__new__(KeithleyUI)
+        ui.logger = DataLogger()
+        for voltage, current in points:
+            ui.logger.add(voltage, current)
+        ui.row_cycle_ids = [2, 2, 1, 1, 3, 2, 1]
+
+        def reference(xscale, yscale, skip_tail):
+            # The original per-row grouping; cycle ids missing at the end count as cycle 0.
+            rows_len = len(points) - skip_tail
+            cycle_ids = (ui.row_cycle_ids + [0] * rows_len)[:rows_len]
+            series = {}
+            for (voltage, current), cycle_id in zip(points, cycle_ids):
+                if xscale == "log" and voltage <= 0:
+                    continue
+                if yscale == "log":
+                    current = abs(current)
+                    if current == 0:
+                        continue
+                series.setdefault(cycle_id, {"x": [], "y": []})
+                series[cycle_id]["x"].append(voltage)
+                series[cycle_id]["y"].append(current)
+            return series
+
+        for xscale in ("linear", "log"):
+            for yscale in ("linear", "log"):
+                for skip_tail in (0, 1, 3):
+                    series = ui._build_cycle_series(xscale, yscale, skip_tail=skip_tail)
+                    expected = reference(xscale, yscale, skip_tail)
+                    self.assertEqual(list(series), list(expected))
+                    for cycle_id, values in expected.items():
+                        self.assertEqual(list(series[cycle_id]["x"]), values["x"])
+                        self.assertEqual(list(series[cycle_id]["y"]), values["y"])
+
+        series = ui._build_cycle_series("log", "log", skip_tail=0)
+        self.assertEqual(list(series), [2, 1, 0])
+        self.assertEqual(list(series[2]["x"]), [0.5])
+        self.assertEqual(list(series[1]["y"]), [3e-6, 6e-6])
+        ui.logger.add(0.6, 8e-6)
+        self.assertEqual(list(ui._build_cycle_series("log", "log", skip_tail=0)[0]["x"]), [0.4, 0.6])
+
+    def test_build_sweep_values_endpoints_and_direction(self):
+        build = KeithleyUI._build_sweep_values
+        self.assertEqual(build(0.0, 1.0, 0.25), [0.0, 0.25, 0.5, 0.75, 1.0])
+        self.assertEqual(build(0.0, 0.3, 0.1), [0.0, 0.1, 0.2, 0.3])
+        self.assertEqual(build(1.0, -1.0, -0.5), [1.0, 0.5, 0.0, -0.5, -1.0])
+        self.assertEqual(build(0.0, 1.0, 0.3), [0.0, 0.3, 0.6, 0.9])
+        self.assertEqual(build(0.0, -1.0, -0.3), [0.0, -0.3, -0.6, -0.9])
+        self.assertEqual(build(0.5, 0.5, 0.1), [0.5])
+        self.assertEqual(build(0.0, 1.0, -0.1), [])
+        self.assertEqual(build(1.0, 0.0, 0.1), [])
+        self.assertEqual(build(0.0, 1.0, 0.0), [])
+
     def test_custom_sequence_keeps_single_point_segments_and_repeats_cycles(self):
         ui = KeithleyUI.__new__(KeithleyUI)
         ui.custom_segments = [(0.0, 0.0), (1.0, 1.0), (0.0, 0.0)]
@@ -303,6 +406,132 @@ class KeithleyUIRegressions(unittest.TestCase):
         self.assertEqual(ui.root.cancelled, [])
         self.assertEqual(ui._fast_sweep_poll_after_id, "poll-1")
 
+    def test_stop_drains_points_queued_by_exited_host_sweep_worker(self):
+        import queue
+
+        ui = KeithleyUI.__new__(KeithleyUI)
+        ui.stop_flag = False
+        ui.live_running = False
+        ui.live_after_id = None
+        ui.sweep_after_id = "drain-1"
+        ui.root = _DummyRoot()
+        ui.connected = False
+        ui.autosave_enabled = False
+        ui.logger = DataLogger()
+        ui.row_cycle_ids = []
+        ui.row_time_s = []
+        ui._sweep_values = [0.1, 0.2]
+        ui._sweep_cycle_ids = [1, 1]
+        ui._sweep_point_times = [None, None]
+        ui._sweep_index = 0
+        ui._frames_since_draw = 0
+        ui._sweep_thread = _DummyThread(alive=False)
+        ui._sweep_result_q = queue.Queue()
+        for item in ((0.1, 1e-6, None), (0.2, 2e-6, None), None):
+            ui._sweep_result_q.put(item)
+        ui.status_text = _DummyTextVar()
+        ui.progress_text = _DummyTextVar()
+        ui._update_button_states = lambda: None
+        ui._update_progress = lambda *_args, **_kwargs: None
+        ui._refresh_plot_decimated = lambda _points=1: None
+        zeroed = []
+        ui.connection = SimpleNamespace(zero_output=lambda: zeroed.append(True))
+
+        ui.stop()
+
+        self.assertEqual(zeroed, [True])
+        self.assertEqual(ui.root.cancelled, [])
+        self.assertEqual(ui.logger.rows, [])
+        ui._drain_sweep_results()
+        self.assertEqual([row.voltage for row in ui.logger.rows], [0.1, 0.2])
+        self.assertIsNone(ui._sweep_thread)
+        self.assertFalse(ui.sweep_running)
+        self.assertEqual(ui.status_text.get(), "Stopped. Output zeroed.")
+
+    def test_sweep_drain_error_finishes_run_and_zeroes_output(self):
+        import queue
+        import threading
+
+        import gui as gui_module
+
+        ui = KeithleyUI.__new__(KeithleyUI)
+        ui.stop_flag = False
+        ui.sweep_running = True
+        ui.live_running = False
+        ui.live_after_id = None
+        ui.root = _DummyRoot()
+        ui.connected = True
+        ui.autosave_enabled = True
+        ui.logger = DataLogger()
+        ui.logger.output_file = Path("unused.csv")
+        ui.logger._header_written = True
+        ui.logger._write_error = OSError("disk full")
+        ui.row_cycle_ids = []
+        ui.row_time_s = []
+        ui._sweep_values = [0.1]
+        ui._sweep_cycle_ids = [1]
+        ui._sweep_point_times = [None]
+        ui._sweep_index = 0
+        ui._frames_since_draw = 0
+        ui._sweep_stop_event = threading.Event()
+        ui._sweep_thread = _DummyThread(alive=True)
+        ui._sweep_result_q = queue.Queue()
+        ui._sweep_result_q.put((0.1, 1e-6, None))
+        ui.status_text = _DummyTextVar()
+        ui.progress_text = _DummyTextVar()
+        ui._update_button_states = lambda: None
+        zeroed = []
+        ui.connection = SimpleNamespace(zero_output=lambda: zeroed.append(True))
+        ui.logger._append_buffer = [Measurement("2026-01-01T00:00:00", 0.0, 0.0)]
+        ui.logger._append_threshold = 1
+
+        errors = []
+        original_error = gui_module.messagebox.showerror
+        try:
+            gui_module.messagebox.showerror = lambda *args, **_kwargs: errors.append(args)
+            ui._drain_sweep_results()
+        finally:
+            gui_module.messagebox.showerror = original_error
+
+        self.assertIn("Auto-save write failed", errors[0][1])
+        self.assertTrue(ui._sweep_stop_event.is_set())
+        self.assertFalse(ui.sweep_running)
+        self.assertIsNone(ui._sweep_thread)
+        self.assertEqual(zeroed, [True])
+        self.assertEqual(ui.root.after_calls, [])
+
+    def test_pd_reads_only_refresh_buttons_on_first_row(self):
+        class _Conn:
+            def measure_current(self):
+                return 1e-6
+
+        ui = KeithleyUI.__new__(KeithleyUI)
+        ui.connection = _Conn()
+        ui.autosave_enabled = False
+        ui.logger = DataLogger()
+        ui.row_cycle_ids = []
+        ui.row_time_s = []
+        ui.status_text = _DummyTextVar()
+        ui._pd_steps = [
+            {"voltage": 0.1, "measure": True, "point_t": k + 1, "cycle_id": 1, "elapsed_s": None}
+            for k in range(3)
+        ]
+        ui._sweep_index = 0
+        button_updates = []
+        ui._annotate_last_row = lambda **kwargs: None
+        ui._refresh_plot_decimated = lambda: None
+        ui._update_button_states = lambda: button_updates.append(len(ui.logger.rows))
+
+        def advance(post_delay_s=0.0):
+            ui._sweep_index += 1
+
+        ui._advance_pd_step = advance
+        for _ in range(3):
+            ui._complete_pd_read_step()
+
+        self.assertEqual(len(ui.logger.rows), 3)
+        self.assertEqual(button_updates, [1])
+
     def test_pd_txt_round_trip_and_append_numbering(self):
         path = Path("pd_test_round_trip_tmp.txt")
         try:
@@ -339,6 +568,236 @@ class KeithleyUIRegressions(unittest.TestCase):
         finally:
             path.unlink(missing_ok=True)
 
+    def test_load_csv_normalizes_short_and_extra_field_rows(self):
+        path = Path("csv_test_row_width_tmp.csv")
+        try:
+            path.write_text(
+                "timestamp,voltage,current\n"
+                "2024-01-01T00:00:00,1.0,2.0\n"
+                "2024-01-01T00:00:01,1.5,2.5,EXTRA\n",
+                encoding="utf-8",
+            )
+            loaded = DataLogger()
+            loaded.load_csv(str(path))
+            self.assertEqual([(row.voltage, row.current) for row in loaded.rows], [(1.0, 2.0), (1.5, 2.5)])
+            self.assertTrue(all(row.elapsed_s is None and row.cycle_id == 0 for row in loaded.rows))
+            self.assertTrue(all(row.plot_mode == "iv" and row.run_description == "" for row in loaded.rows))
+
+            path.write_text(
+                "timestamp,voltage,current,sample_name,operator,notes,elapsed_s,cycle_id,plot_mode,run_description\n"
+                "2024-01-01T00:00:00,1.0,2.0,s1,op\n"
+                "2024-01-01T00:00:01,1.5,2.5,s1,op,n,0.5,2,wrer,desc,EXTRA\n",
+                encoding="utf-8",
+            )
+            loaded.load_csv(str(path))
+            short, extra = loaded.rows
+            self.assertEqual((short.sample_name, short.operator, short.notes), ("s1", "op", ""))
+            self.assertEqual((short.elapsed_s, short.cycle_id, short.plot_mode), (None, 0, "iv"))
+            self.assertEqual((extra.elapsed_s, extra.cycle_id, extra.plot_mode), (0.5, 2, "wrer"))
+            self.assertEqual(extra.run_description, "desc")
+
+            logger = DataLogger()
+            logger.set_metadata("sample, with comma", "op", 'say "hi"')
+            logger.add(0.25, -1.5e-6)
+            logger.rows[-1].elapsed_s = 1.25
+            logger.rows[-1].cycle_id = 3
+            logger.save_csv(str(path))
+            loaded.load_csv(str(path))
+            self.assertEqual(loaded.rows, logger.rows)
+        finally:
+            path.unlink(missing_ok=True)
+
+    def test_appended_csv_rows_match_csv_writer(self):
+        import csv
+        import io
+
+        path = Path("csv_test_writer_match_tmp.csv")
+        try:
+            path.unlink(missing_ok=True)
+            logger = DataLogger()
+            logger.set_output_file(str(path), reset_file=True)
+            rows = [
+                Measurement("2026-01-01T00:00:00", 1.0, -2.5e-06, "a,b", 'say "hi"', "line1\nline2", 0.125, 2, "iv", "x\r\ny"),
+                Measurement("2026-01-01T00:00:01", 0.1, 3e-12, "", "", "", None, 0, "wrer", ""),
+                Measurement("2026-01-01T00:00:02", -1e-07, float("nan"), '"', ",", "\r", 1.0, 1, "pd", "plain"),
+            ]
+            logger._append_rows(rows)
+
+            expected = io.StringIO(newline="")
+            writer = csv.writer(expected)
+            writer.writerow(
+                [
+                    "timestamp",
+                    "voltage",
+                    "current",
+                    "sample_name",
+                    "operator",
+                    "notes",
+                    "elapsed_s",
+                    "cycle_id",
+                    "plot_mode",
+                    "run_description",
+                ]
+            )
+            for row in rows:
+                writer.writerow(
+                    [
+                        row.timestamp,
+                        row.voltage,
+                        row.current,
+                        row.sample_name,
+                        row.operator,
+                        row.notes,
+                        "" if row.elapsed_s is None else row.elapsed_s,
+                        row.cycle_id,
+                        row.plot_mode,
+                        row.run_description,
+                    ]
+                )
+            self.assertEqual(path.read_bytes().decode("utf-8"), expected.getvalue())
+        finally:
+            path.unlink(missing_ok=True)
+
+    def test_autosave_flushes_batches_at_threshold_and_interval(self):
+        path = Path("csv_test_autosave_batch_tmp.csv")
+        try:
+            path.unlink(missing_ok=True)
+            logger = DataLogger()
+            logger._append_threshold = 3
+            logger._append_flush_s = 3600.0
+            logger.set_output_file(str(path), reset_file=True)
+
+            def saved_voltages():
+                logger._wait_for_writes()
+                return [float(line.split(",")[1]) for line in path.read_text(encoding="utf-8").splitlines()[1:]]
+
+            for k in range(3):
+                logger.add(float(k), 1e-6, auto_save=True)
+            self.assertEqual(saved_voltages(), [])
+            logger.add(3.0, 1e-6, auto_save=True)
+            self.assertEqual(saved_voltages(), [0.0, 1.0, 2.0])
+
+            logger._last_flush_t -= 3600.0
+            logger.add(4.0, 1e-6, auto_save=True)
+            self.assertEqual(saved_voltages(), [0.0, 1.0, 2.0, 3.0])
+
+            logger.flush()
+            self.assertEqual(saved_voltages(), [0.0, 1.0, 2.0, 3.0, 4.0])
+        finally:
+            path.unlink(missing_ok=True)
+
+    def test_autosave_batches_keep_annotations_and_pd_numbering(self):
+        csv_path = Path("csv_test_autosave_annotate_tmp.csv")
+        txt_path = Path("pd_test_autosave_numbering_tmp.txt")
+        try:
+            csv_path.unlink(missing_ok=True)
+            txt_path.unlink(missing_ok=True)
+            logger = DataLogger()
+            logger._append_threshold = 2
+            logger.set_output_file(str(csv_path), reset_file=True)
+            for k in range(5):
+                logger.add(float(k), 1e-6, auto_save=True)
+                logger.rows[-1].cycle_id = k + 1
+                logger.rows[-1].elapsed_s = k * 0.5
+                logger.rows[-1].plot_mode = "wrer"
+            logger.flush()
+            loaded = DataLogger()
+            loaded.load_csv(str(csv_path))
+            self.assertEqual(loaded.rows, logger.rows)
+
+            pd_logger = DataLogger()
+            pd_logger._append_threshold = 2
+            pd_logger.set_run_description("PD batch")
+            pd_logger.set_output_file(str(txt_path), reset_file=True)
+            for current in (1e-6, float("nan"), 2e-6, 3e-6, float("nan"), 4e-6):
+                pd_logger.add(0.1, current, auto_save=True)
+                pd_logger.rows[-1].plot_mode = "pd"
+            pd_logger.flush()
+            lines = [line.split("\t") for line in txt_path.read_text(encoding="utf-8").splitlines()[2:]]
+            self.assertEqual([int(fields[0]) for fields in lines], [1, 2, 3, 4])
+            self.assertEqual([float(fields[1]) for fields in lines], [1e-6, 2e-6, 3e-6, 4e-6])
+        finally:
+            csv_path.unlink(missing_ok=True)
+            txt_path.unlink(missing_ok=True)
+
+    def test_background_write_error_surfaces_on_next_add(self):
+        path = Path("csv_test_autosave_error_tmp.csv")
+        try:
+            path.unlink(missing_ok=True)
+            logger = DataLogger()
+            logger._append_threshold = 1
+            logger.set_output_file(str(path), reset_file=True)
+            logger.output_file = Path("missing_dir_for_autosave_test") / "data.csv"
+
+            logger.add(0.1, 1e-6, auto_save=True)
+            logger.add(0.2, 1e-6, auto_save=True)
+            logger._write_q.join()
+            with self.assertRaisesRegex(RuntimeError, "Auto-save write failed"):
+                logger.add(0.3, 1e-6, auto_save=True)
+            logger.flush()
+        finally:
+            path.unlink(missing_ok=True)
+
+    def test_add_many_matches_sequential_add(self):
+        paths = [Path("csv_test_add_many_tmp.csv"), Path("csv_test_add_sequential_tmp.csv")]
+        voltages = [0.1, 0.2, -0.3]
+        currents = [1e-6, float("nan"), -3e-6]
+        cycle_ids = [1, 1, 2]
+        elapsed = [0.0, None, 1]
+        try:
+            loggers = []
+            for path in paths:
+                path.unlink(missing_ok=True)
+                logger = DataLogger()
+                logger._timestamp = lambda: "2026-01-01T00:00:00"
+                logger.set_metadata("sample", "op", "notes")
+                logger.set_run_description("run")
+                logger.set_output_file(str(path), reset_file=True)
+                logger.add(0.0, 0.0, auto_save=True)
+                loggers.append(logger)
+            batch_logger, sequential_logger = loggers
+
+            batch_logger.add_many(voltages, currents, cycle_ids, elapsed, plot_mode="wrer", auto_save=True)
+            for voltage, current, cycle_id, point_t in zip(voltages, currents, cycle_ids, elapsed):
+                sequential_logger.add(voltage, current, auto_save=True)
+                row = sequential_logger.rows[-1]
+                row.cycle_id = cycle_id
+                row.elapsed_s = None if point_t is None else float(point_t)
+                row.plot_mode = "wrer"
+            for logger in loggers:
+                logger.flush()
+
+            self.assertEqual(repr(batch_logger.rows), repr(sequential_logger.rows))
+            self.assertEqual(batch_logger.voltages.tolist(), sequential_logger.voltages.tolist())
+            self.assertEqual(repr(batch_logger.currents.tolist()), repr(sequential_logger.currents.tolist()))
+            self.assertEqual(batch_logger.revision, sequential_logger.revision)
+            self.assertEqual(paths[0].read_bytes(), paths[1].read_bytes())
+        finally:
+            for path in paths:
+                path.unlink(missing_ok=True)
+
+    def test_live_ring_buffer_keeps_newest_points_in_order(self):
+        import numpy as np
+
+        ui = KeithleyUI.__new__(KeithleyUI)
+        ui.max_live_points = 4
+        ui._rb_v = np.empty(0)
+        ui._rb_reset()
+
+        def pushed(count, start=0):
+            for k in range(start, start + count):
+                ui._rb_push(float(k), -float(k))
+            voltages, currents = ui._rb_view()
+            return voltages.tolist(), currents.tolist()
+
+        self.assertEqual(pushed(3), ([0.0, 1.0, 2.0], [-0.0, -1.0, -2.0]))
+        self.assertEqual(pushed(4, start=3)[0], [3.0, 4.0, 5.0, 6.0])
+        self.assertEqual(pushed(1, start=7), ([4.0, 5.0, 6.0, 7.0], [-4.0, -5.0, -6.0, -7.0]))
+        self.assertEqual(pushed(6, start=8)[0], [10.0, 11.0, 12.0, 13.0])
+
+        ui._rb_reset()
+        self.assertEqual(pushed(0), ([], []))
+
     def test_sync_metadata_uses_pd_sample_only_in_pd_mode(self):
         ui = KeithleyUI.__new__(KeithleyUI)
         ui.sample_entry = _DummyEntry("base-sample")
@@ -376,11 +835,12 @@ class KeithleyUIRegressions(unittest.TestCase):
     def test_load_dialog_allows_pd_text_files(self):
         ui = KeithleyUI.__new__(KeithleyUI)
         ui.logger = SimpleNamespace(rows=[], load_csv=lambda _path: None)
-        ui.preferred_save_dir = "C:\\data"
+        ui.preferred_save_dir = "C:\\data\\missing_folder_for_test"
         ui.autosave_enabled = True
         ui.save_path_text = _DummyTextVar()
         ui.save_dir_text = _DummyTextVar()
         ui.autosave_text = _DummyTextVar()
+        ui.status_text = _DummyTextVar()
         ui._refresh_embedded_plot = lambda: None
         ui._update_button_states = lambda: None
 
@@ -405,6 +865,8 @@ class KeithleyUIRegressions(unittest.TestCase):
             gui_module.messagebox.showerror = original_error
 
         self.assertEqual(captured["title"], "Load Existing Measurement File")
+        self.assertEqual(captured["initialdir"], os.getcwd())
+        self.assertIn("Save folder not found: C:\\data\\missing_folder_for_test", ui.status_text.get())
         self.assertIn(("Measurement Files", "*.csv *.txt"), captured["filetypes"])
 
     def test_on_close_defers_connection_close_while_fast_thread_alive(self):
@@ -416,13 +878,16 @@ class KeithleyUIRegressions(unittest.TestCase):
         ui._save_ui_settings = lambda: None
         ui.stop = lambda: None
         close_called = {"value": False}
-        ui.connection = SimpleNamespace(close=lambda: close_called.__setitem__("value", True))
+        closed = []
+        ui.logger = SimpleNamespace(close=lambda: closed.append("logger"))
+        ui.connection = SimpleNamespace(close=lambda: (closed.append("connection"), close_called.__setitem__("value", True)))
 
         ui.on_close()
 
         self.assertTrue(ui._closing)
         self.assertFalse(ui.root.destroyed)
         self.assertFalse(close_called["value"])
+        self.assertEqual(closed, [])
         self.assertEqual(len(ui.root.after_calls), 1)
         token, _delay_ms, callback = ui.root.after_calls[0]
         self.assertEqual(ui._close_wait_after_id, token)
@@ -430,6 +895,7 @@ class KeithleyUIRegressions(unittest.TestCase):
         ui._fast_sweep_thread = _DummyThread(alive=False)
         callback()
         self.assertTrue(close_called["value"])
+        self.assertEqual(closed, ["logger", "connection"])
         self.assertTrue(ui.root.destroyed)
 
 